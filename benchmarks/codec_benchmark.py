@@ -0,0 +1,60 @@
+"""Compares JSON decoding and encoding time of the available codecs on large list pages
+
+Usage: PYTHONPATH=. python benchmarks/codec_benchmark.py [path/to/recorded_page.json ...]
+
+Without arguments, a synthetic page of 1000 expanded orders is used.
+"""
+
+import json
+import sys
+import timeit
+
+from swellpy import codec
+
+
+def synthetic_page(count: int = 1000) -> bytes:
+    item = {
+        'product_id': '5e31e67be53f9a59d89600f1',
+        'variant_id': '5e31e67be53f9a59d89600f2',
+        'quantity': 2,
+        'price': 19.99,
+        'price_total': 39.98,
+        'options': [{'id': 'size', 'name': 'Size', 'value': 'Large'}],
+        'product': {'id': '5e31e67be53f9a59d89600f1', 'name': 'Product name', 'sku': 'SKU-1', 'active': True},
+    }
+    order = {
+        'id': '5e31e67be53f9a59d89600f0',
+        'number': '100001',
+        'status': 'complete',
+        'date_created': '2022-01-01T00:00:00.000Z',
+        'currency': 'USD',
+        'items': [item] * 5,
+        'billing': {'name': 'Jane Doe', 'address1': '1 Main St', 'city': 'Springfield', 'zip': '12345'},
+        'shipping': {'name': 'Jane Doe', 'address1': '1 Main St', 'city': 'Springfield', 'zip': '12345'},
+        'grand_total': 199.9,
+    }
+
+    return json.dumps({'count': count, 'page': 1, 'results': [order] * count}).encode()
+
+
+def benchmark(name: str, data: bytes, number: int = 20):
+    value = json.loads(data)
+    results = {
+        'json.loads': timeit.timeit(lambda: json.loads(data), number=number),
+        f'{codec.backend} loads': timeit.timeit(lambda: codec.loads(data), number=number),
+        'json.dumps': timeit.timeit(lambda: json.dumps(value).encode(), number=number),
+        f'{codec.backend} dumps': timeit.timeit(lambda: codec.dumps(value), number=number),
+    }
+
+    print(f'{name} ({len(data) / 1e6:.1f} MB)')
+    for label, seconds in results.items():
+        print(f'  {label:<16} {seconds / number * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as file:
+                benchmark(path, file.read())
+    else:
+        benchmark('1000 orders', synthetic_page())
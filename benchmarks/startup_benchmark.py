@@ -0,0 +1,37 @@
+"""Measures the cold start cost of swellpy: import time, client construction and first model access
+
+Usage: PYTHONPATH=. python benchmarks/startup_benchmark.py
+"""
+
+import statistics
+import subprocess
+import sys
+import timeit
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import swellpy
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(runs: int = 20) -> float:
+    """Median seconds to import swellpy in a fresh interpreter"""
+
+    return statistics.median(
+        float(subprocess.check_output([sys.executable, '-c', IMPORT])) for run in range(runs))
+
+
+if __name__ == '__main__':
+    from swellpy import Swell
+
+    params = {'store_id': 'store_id', 'api_key': 'api_key'}
+    number = 200
+
+    construct = timeit.timeit(lambda: Swell(params), number=number) / number
+    first_model = timeit.timeit(lambda: Swell(params).orders, number=number) / number
+
+    print(f'import swellpy         {import_time() * 1000:8.2f} ms')
+    print(f'Swell()                {construct * 1000:8.3f} ms')
+    print(f'Swell().orders         {first_model * 1000:8.3f} ms')
@@ -10,8 +10,12 @@ setup(
     author_email='greg@swell.is, mustafa@swell.is',
     packages=find_packages(),
     install_requires=[
-        'requests',
-        'requests_toolbelt',
-        'ratelimit'
-    ]
+        'requests'
+    ],
+    extras_require={
+        'async': ['httpx'],
+        'fast': ['orjson'],
+        'brotli': ['brotli'],
+        'http2': ['httpx[http2]']
+    }
 )
\ No newline at end of file
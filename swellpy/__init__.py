@@ -1 +1,17 @@
-from .swell import Swell
\ No newline at end of file
+import logging
+
+from .swell import Swell
+
+# Log records are only emitted when the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+__all__ = ['Swell', 'AsyncSwell']
+
+
+def __getattr__(name: str):
+    # AsyncSwell is imported on first use, so sync users do not load asyncio
+    if name == 'AsyncSwell':
+        from .async_swell import AsyncSwell
+        return AsyncSwell
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+
+from typing import AsyncIterator, Optional
+
+from .compression import accept_encoding
+from .singleflight import AsyncSingleFlight
+from .streaming import ResultsParser, acounted, aiter_results
+from .swell import Swell, STREAM_CHUNK_SIZE
+from .transport import create_httpx_client, http2_available
+from .utilities import log_response
+
+
+class AsyncSwell(Swell):
+    """
+    The AsyncSwell class provides asyncio access to Swell's API
+
+    Models and their methods mirror the Swell class, but return coroutines
+    which resolve to the same JSON responses. All models share one pooled
+    httpx.AsyncClient, so a single event loop can drive many requests at once.
+
+    Requires httpx (pip install swellpy[async]).
+
+    """
+
+    _is_async = True
+    _body_argument = 'content'
+    _single_flight = AsyncSingleFlight
+
+    def _create_session(self, store_id: str, api_key: str):
+        """Creates the pooled async HTTP client shared by all models
+
+        With the http2 option, requests are multiplexed over HTTP/2 connections when h2 is installed.
+        """
+
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "AsyncSwell requires httpx. "
+                "Install it with `pip install swellpy[async]`")
+
+        self._transport_errors = (httpx.TransportError,)
+
+        http2 = self._options.get("http2", False)
+        if http2 and not http2_available():
+            self.logger.warning(
+                'HTTP/2 requires h2 (pip install swellpy[http2]), falling back to HTTP/1.1')
+            http2 = False
+
+        return create_httpx_client(
+            httpx.AsyncClient, self._options, (store_id, api_key),
+            {'Accept-Encoding': accept_encoding()}, http2=http2)
+
+    async def _request(self, model, method: str, url: str, **kwargs) -> dict:
+        """Sends a request on behalf of a model and returns the handled JSON response
+
+        Failed requests are retried according to the retry policy.
+        """
+
+        event = self._start_event(model, method, url)
+        try:
+            result = self._handle(await self._send(model, method, url, event=event, **kwargs), event)
+        except BaseException as error:
+            self._emit(event, error)
+            raise
+
+        self._emit(event)
+
+        return result
+
+    async def _stream(self, model, url: str, params: Optional[dict], parser: ResultsParser) -> AsyncIterator[dict]:
+        """Sends a list request and yields its results as they are parsed from the response body
+
+        The AsyncSwell equivalent of Swell._stream.
+        """
+
+        event = self._start_event(model, 'get', url)
+        try:
+            response = await self._send(model, 'get', url, params=params, stream=True, event=event)
+            try:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._handle(response, event)
+
+                if self._log_sampled():
+                    log_response(self, response)
+                chunks = acounted(response.aiter_bytes(STREAM_CHUNK_SIZE), event)
+                async for item in aiter_results(chunks, parser):
+                    yield item
+            finally:
+                await response.aclose()
+        except GeneratorExit:
+            # The caller stopped consuming items early
+            self._emit(event)
+            raise
+        except BaseException as error:
+            self._emit(event, error)
+            raise
+
+        self._emit(event)
+
+        if 'errors' in parser.meta and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(parser.meta['errors'])
+
+    async def _send(self, model, method: str, url: str, stream: bool = False, event: Optional[dict] = None, **kwargs):
+        """Sends a request within the rate limit, retrying it according to the retry policy
+
+        Returns:
+            The final response, unhandled
+        """
+
+        kwargs = self._prepare_request(kwargs)
+
+        attempt = 1
+        while True:
+            wait = await self.limiter.acquire_async()
+            sent = time.perf_counter()
+
+            try:
+                if stream:
+                    request = self._session.build_request(method.upper(), url, **kwargs)
+                    response = await self._session.send(request, stream=True)
+                else:
+                    response = await getattr(self._session, method)(url=url, **kwargs)
+            except self._transport_errors:
+                response = None
+                self._record_attempt(event, attempt, wait, sent, response)
+                delay = self.retry.next_delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                self._record_attempt(event, attempt, wait, sent, response)
+                delay = self.retry.next_delay(method, attempt, response)
+                if delay is None:
+                    return response
+                if stream:
+                    await response.aclose()
+
+            delay = self._backoff(method, url, attempt, delay, response)
+            if delay:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _resolve(self, value):
+        return value
+
+    async def _then(self, result, callback):
+        return callback(await result)
+
+    async def _gather(self, results: list):
+        return await asyncio.gather(*results)
+
+    async def _map(self, fn, items: list, concurrency: int) -> list:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(item):
+            async with semaphore:
+                return await fn(item)
+
+        return await asyncio.gather(*[call(item) for item in items], return_exceptions=True)
+
+    def close(self):
+        raise TypeError("Use aclose with an AsyncSwell client")
+
+    def __enter__(self):
+        raise TypeError("Use async with with an AsyncSwell client")
+
+    async def aclose(self):
+        """Closes the underlying HTTP client and its pooled connections
+
+        A transport shared through the "transport" option (ie by an AsyncSwellPool) is left open.
+        """
+
+        if self._options.get("transport") is None:
+            await self._session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
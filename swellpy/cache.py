@@ -0,0 +1,254 @@
+import json
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+
+class CacheBackend:
+    """Interface of the response caches used by the model layer
+
+    Entries are JSON-serializable responses stored under a key for a TTL in seconds.
+    Each entry can carry tags (ie a model and record id), which are used to invalidate
+    every entry related to a record after it changes. Implementations must be thread-safe.
+
+    """
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the cached response for key, or None if missing or expired"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: dict, ttl: float, tags: Iterable[str] = ()):
+        """Caches a response for ttl seconds"""
+        raise NotImplementedError
+
+    def invalidate(self, tag: str):
+        """Removes every entry carrying tag"""
+        raise NotImplementedError
+
+    def clear(self):
+        """Removes every entry"""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """An in-process LRU cache for API responses
+
+    Entries expire after their TTL and the least recently used entries are evicted
+    once the cache holds more than `max_entries` entries or `max_bytes` bytes.
+    Responses are stored serialized, so callers always get their own copy.
+
+    Args:
+        max_entries (optional): maximum number of cached responses
+        max_bytes (optional): maximum total size of the cached responses
+
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            data, expires, tags = entry
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+        return json.loads(data)
+
+    def set(self, key: str, value: dict, ttl: float, tags: Iterable[str] = ()):
+        data = json.dumps(value)
+        tags = tuple(tags)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (data, time.monotonic() + ttl, tags)
+            self._bytes += len(data)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while self._entries and (
+                    len(self._entries) > self.max_entries
+                    or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tag: str):
+        with self._lock:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        data, expires, tags = self._entries.pop(key)
+        self._bytes -= len(data)
+
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class SQLiteCache(CacheBackend):
+    """A response cache stored in a SQLite database shared by processes on one host
+
+    Every process (ie gunicorn or Celery workers) opening the same file shares the
+    cached responses. Expired entries are swept, and least recently used entries
+    evicted to respect `max_entries` and `max_bytes`, at most every `sweep_interval`
+    seconds, so the caps may be briefly exceeded between sweeps. Reads only write an
+    entry's access time when it is older than a tenth of `sweep_interval`, so cache hits
+    seldom queue on the database write lock.
+
+    Args:
+        path: database file, created if missing
+        max_entries (optional): maximum number of cached responses
+        max_bytes (optional): maximum total size of the cached responses
+        sweep_interval (optional): minimum seconds between sweeps
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10000,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 60
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._local = threading.local()
+        self._swept = time.monotonic()
+
+        with self._connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY, value TEXT, expires REAL, size INTEGER, accessed REAL);
+                CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+                CREATE TABLE IF NOT EXISTS tags (tag TEXT, key TEXT, PRIMARY KEY (tag, key));
+                CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+            """)
+
+    def _connection(self) -> 'sqlite3.Connection':
+        import sqlite3
+
+        # Connections cannot be shared between threads, nor survive a fork
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            local.connection = sqlite3.connect(self.path, timeout=30)
+            local.connection.execute('PRAGMA journal_mode=WAL')
+            local.connection.execute('PRAGMA synchronous=NORMAL')
+            local.pid = os.getpid()
+
+        return local.connection
+
+    def get(self, key: str) -> Optional[dict]:
+        now = time.time()
+
+        with self._connection() as connection:
+            row = connection.execute(
+                'SELECT value, accessed FROM entries WHERE key = ? AND expires > ?', (key, now)).fetchone()
+            if row is None:
+                return None
+
+            # Finer access times would not change which entries a sweep evicts
+            if now - row[1] >= self.sweep_interval / 10:
+                connection.execute('UPDATE entries SET accessed = ? WHERE key = ?', (now, key))
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: dict, ttl: float, tags: Iterable[str] = ()):
+        data = json.dumps(value)
+        now = time.time()
+
+        with self._connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                (key, data, now + ttl, len(data), now))
+            connection.execute('DELETE FROM tags WHERE key = ?', (key,))
+            connection.executemany(
+                'INSERT OR IGNORE INTO tags VALUES (?, ?)', [(tag, key) for tag in tags])
+
+        if time.monotonic() - self._swept >= self.sweep_interval:
+            self.sweep()
+
+    def invalidate(self, tag: str):
+        with self._connection() as connection:
+            connection.execute(
+                'DELETE FROM entries WHERE key IN (SELECT key FROM tags WHERE tag = ?)', (tag,))
+            connection.execute('DELETE FROM tags WHERE tag = ?', (tag,))
+
+    def clear(self):
+        with self._connection() as connection:
+            connection.execute('DELETE FROM entries')
+            connection.execute('DELETE FROM tags')
+
+    def sweep(self):
+        """Removes expired entries, then evicts least recently used entries over the caps"""
+
+        self._swept = time.monotonic()
+
+        with self._connection() as connection:
+            connection.execute('DELETE FROM entries WHERE expires <= ?', (time.time(),))
+            connection.execute(
+                'DELETE FROM entries WHERE key IN '
+                '(SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,))
+            if self.max_bytes is not None:
+                connection.execute(
+                    'DELETE FROM entries WHERE key IN (SELECT key FROM '
+                    '(SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS total FROM entries) '
+                    'WHERE total > ?)',
+                    (self.max_bytes,))
+            connection.execute('DELETE FROM tags WHERE key NOT IN (SELECT key FROM entries)')
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+
+def create_cache(options: dict) -> CacheBackend:
+    """Creates the cache backend described by the Swell "cache" option
+
+    The "backend" option can be "memory" (default), "sqlite" (with a "path"),
+    or any CacheBackend instance.
+    """
+
+    backend = options.get("backend", "memory")
+
+    if isinstance(backend, CacheBackend):
+        return backend
+    if backend == "memory":
+        return MemoryCache(options.get("max_entries", 1000), options.get("max_bytes"))
+    if backend == "sqlite":
+        if "path" not in options:
+            raise ValueError("The sqlite cache backend requires a 'path' option")
+        return SQLiteCache(
+            options["path"], options.get("max_entries", 10000),
+            options.get("max_bytes"), options.get("sweep_interval", 60))
+
+    raise ValueError(f"Unknown cache backend: {backend}")
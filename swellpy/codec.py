@@ -0,0 +1,76 @@
+"""JSON encoding and decoding of request and response bodies
+
+Uses orjson or ujson when installed (pip install swellpy[fast]), falling back to the
+standard library. With every backend, Decimals are encoded as numbers, dates and
+datetimes as ISO 8601 strings, and values the fast backends reject (ie integers
+beyond 64 bits) are encoded by the standard library, as they were by requests.
+"""
+
+import json
+
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=_default, separators=(',', ':')).encode()
+
+
+if orjson is not None:
+    backend = 'orjson'
+
+    def dumps(value: Any) -> bytes:
+        """Encodes a value to JSON bytes"""
+        try:
+            return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _json_dumps(value)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decodes JSON bytes or text, raising ValueError when invalid"""
+        return orjson.loads(data)
+
+elif ujson is not None:
+    backend = 'ujson'
+
+    def dumps(value: Any) -> bytes:
+        """Encodes a value to JSON bytes"""
+        try:
+            return ujson.dumps(value, default=_default, ensure_ascii=False).encode()
+        except (TypeError, OverflowError):
+            return _json_dumps(value)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decodes JSON bytes or text, raising ValueError when invalid"""
+        return ujson.loads(data)
+
+else:
+    backend = 'json'
+
+    def dumps(value: Any) -> bytes:
+        """Encodes a value to JSON bytes"""
+        return _json_dumps(value)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decodes JSON bytes or text, raising ValueError when invalid"""
+        return json.loads(data)
@@ -0,0 +1,50 @@
+"""Compression of request and response bodies
+
+Responses are requested gzip or deflate encoded, and brotli encoded when brotli is
+installed (pip install swellpy[brotli]); requests and httpx decode them transparently.
+Request bodies are only compressed when enabled, as gzip.
+"""
+
+# Compression level of request bodies, a balance of CPU time and size for JSON
+GZIP_LEVEL = 6
+
+# Smallest request body compressed by default, below which gzip saves little
+DEFAULT_THRESHOLD = 16 * 1024
+
+
+def _brotli_available() -> bool:
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        return True
+
+    return False
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding header listing the response encodings the HTTP clients can decode"""
+
+    encodings = ['gzip', 'deflate']
+    if _brotli_available():
+        encodings.append('br')
+
+    return ', '.join(encodings)
+
+
+def compress_body(body: bytes, headers: dict, threshold: int) -> bytes:
+    """Gzips a request body of at least threshold bytes, setting its Content-Encoding header
+
+    Returns:
+        The body to send, unchanged when below threshold
+    """
+
+    if len(body) < threshold:
+        return body
+
+    import gzip
+
+    headers['Content-Encoding'] = 'gzip'
+
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
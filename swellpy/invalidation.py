@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from .models.base import Base
+
+
+class CacheInvalidator:
+    """Keeps a Swell client's cache in sync with changes made anywhere in the store
+
+    Swell records an event each time a record changes (ie product.updated). Events
+    are received either as webhook payloads passed to handle_event, or by calling
+    poll periodically, and the cached responses of the affected record are dropped,
+    or refetched when `refresh` is set. This allows long cache TTLs without serving
+    stale data.
+
+    Args:
+        swell: Swell client whose cache is invalidated
+        refresh (optional): refetch updated records instead of only dropping them
+        since (optional): ISO date to poll events from, defaults to now
+
+    """
+
+    def __init__(self, swell, refresh: bool = False, since: Optional[str] = None):
+        self._swell = swell
+        self.refresh = refresh
+        self._last = {
+            'date_created': since or datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            'id': '',
+        }
+
+    def handle_event(self, event: dict):
+        """Invalidates the cached responses of the record affected by an event or webhook payload
+
+        Args:
+            event: event with a 'type' (ie product.updated), optional 'model' and 'data' with the record id
+
+        Returns:
+            The refreshed record when refresh is set (a coroutine with AsyncSwell), otherwise None
+
+        """
+
+        model = self._model(event)
+        if model is None:
+            return None
+
+        id = (event.get('data') or {}).get('id')
+        model.clear_cache(id)
+
+        if self.refresh and id and not event.get('type', '').endswith('.deleted'):
+            return model.get(id)
+
+        return None
+
+    def poll(self, page_size: int = 100) -> int:
+        """Handles every event created since the last poll
+
+        Returns:
+            Number of events handled
+
+        """
+
+        handled = 0
+
+        for event in self._swell.events.iterate(self._poll_params(), page_size, 'keyset'):
+            self.handle_event(event)
+            self._last = event
+            handled += 1
+
+        return handled
+
+    async def apoll(self, page_size: int = 100) -> int:
+        """Handles every event created since the last poll, with an AsyncSwell client
+
+        Returns:
+            Number of events handled
+
+        """
+
+        handled = 0
+
+        async for event in self._swell.events.aiterate(self._poll_params(), page_size, 'keyset'):
+            refreshed = self.handle_event(event)
+            if refreshed is not None:
+                await refreshed
+            self._last = event
+            handled += 1
+
+        return handled
+
+    def _poll_params(self) -> dict:
+        return {'where': Base._keyset_after(self._last)}
+
+    def _model(self, event: dict) -> Optional[Base]:
+        """Model of the record affected by an event, or None if it is not a known model"""
+
+        name = event.get('model')
+        if not name:
+            # Event types are named after the singular model, ie product.updated
+            singular = event.get('type', '').split('.')[0]
+            name = singular[:-1] + 'ies' if singular.endswith('y') else singular + 's'
+
+        model = getattr(self._swell, name, None)
+
+        return model if isinstance(model, Base) else None
@@ -0,0 +1,164 @@
+import os
+import struct
+import threading
+import time
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class TokenBucket:
+    """A thread-safe token bucket shared by every model of a Swell client
+
+    Tokens refill continuously at `calls / period` per second, up to `burst` tokens.
+    Each request takes one token; when the bucket is empty the token is borrowed
+    against future refills and the caller sleeps until it is paid back. This keeps
+    the client at the configured rate while allowing short bursts.
+
+    Args:
+        calls: number of calls allowed per period
+        period: length of the period in seconds
+        burst (optional): maximum number of tokens that can be saved up, defaults to calls
+
+    """
+
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(self, calls: float, period: float, burst: float = None):
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period must be positive")
+
+        self.rate = calls / period
+        self.burst = burst if burst is not None else calls
+        self._tokens = self.burst
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _state(self):
+        """Holds exclusive access to the bucket state"""
+
+        with self._lock:
+            yield
+
+    def _refill(self, now: float):
+        # A clock set back (ie a state file from before a reboot) refills nothing rather than draining
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait before using it"""
+
+        with self._state():
+            self._refill(self._clock())
+            self._tokens -= 1
+
+            return max(0.0, -self._tokens / self.rate)
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds a new request would currently wait for a token"""
+
+        with self._state():
+            self._refill(self._clock())
+
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Holds back every caller for at least `seconds`, ie after the API asks to slow down"""
+
+        with self._state():
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+    def acquire(self) -> float:
+        """Blocks until a token is available and returns the time waited"""
+
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Waits without blocking the event loop until a token is available"""
+
+        import asyncio
+
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+        return wait
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket shared by every process on the host through a lock file
+
+    The bucket state is stored in the file at `path` and updated under an exclusive
+    flock, so gunicorn workers, Celery pools and other processes pointing at the same
+    file draw from a single budget. All processes should use the same rate options.
+    Requires a POSIX system.
+
+    Args:
+        path: file used to store the shared bucket state, created if missing
+        calls: number of calls allowed per period
+        period: length of the period in seconds
+        burst (optional): maximum number of tokens that can be saved up, defaults to calls
+
+    """
+
+    _format = struct.Struct('dd')
+
+    # The file outlives processes and reboots, which reset the monotonic clock
+    _clock = staticmethod(time.time)
+
+    def __init__(self, path: str, calls: float, period: float, burst: float = None):
+        if fcntl is None:
+            raise NotImplementedError("FileTokenBucket requires a POSIX system")
+
+        super().__init__(calls, period, burst)
+        self.path = path
+        self._fd = None
+        self._pid = None
+
+    def _file(self) -> int:
+        # Forked workers share the parent's open file, and flock does not exclude
+        # holders of the same open file, so each process opens its own
+        if self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+
+        return self._fd
+
+    def close(self):
+        """Closes the state file, which is reopened if the bucket is used again"""
+
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+            self._fd = None
+            self._pid = None
+
+    @contextmanager
+    def _state(self):
+        with self._lock:
+            fd = self._file()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(fd, self._format.size, 0)
+                if len(data) == self._format.size:
+                    self._tokens, self._updated = self._format.unpack(data)
+                else:
+                    self._tokens, self._updated = self.burst, self._clock()
+
+                yield
+
+                os.pwrite(fd, self._format.pack(self._tokens, self._updated), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+
+from concurrent.futures import Future
+from typing import Optional
+
+from .models.base import Base
+
+
+class BatchLoader:
+    """Collects gets issued within a short window and fetches them with one get_many
+
+    Useful to remove N+1 request patterns from threaded code: each load returns a
+    Future immediately, and ids loaded by any thread during `window` seconds are
+    fetched together. Records that do not exist resolve to None.
+
+    Args:
+        model: model to load from, ie swell.products
+        window (optional): seconds to wait for more ids before dispatching a batch
+        params (optional): additional params for every request (ie expand)
+
+    """
+
+    def __init__(self, model: Base, window: float = 0.005, params: Optional[dict] = None):
+        self.model = model
+        self.window = window
+        self.params = params
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def load(self, id: str) -> Future:
+        """Schedules an id to be loaded, returning a Future resolving to its record"""
+
+        if not id or not isinstance(id, str):
+            raise TypeError("id must be a non-empty string")
+
+        with self._lock:
+            if not self._pending:
+                timer = threading.Timer(self.window, self.dispatch)
+                timer.daemon = True
+                timer.start()
+
+            future = self._pending.get(id)
+            if future is None:
+                future = self._pending[id] = Future()
+
+        return future
+
+    def get(self, id: str) -> Optional[dict]:
+        """Loads an id and waits for its record"""
+
+        return self.load(id).result()
+
+    def dispatch(self):
+        """Fetches every pending id now"""
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return
+
+        try:
+            records = self.model.get_many(list(pending), self.params)
+        except Exception as error:
+            for future in pending.values():
+                future.set_exception(error)
+        else:
+            for id, future in pending.items():
+                future.set_result(records.get(id))
+
+
+class AsyncBatchLoader:
+    """Collects gets awaited in the same event loop iteration and fetches them with one get_many
+
+    The asyncio equivalent of BatchLoader, for an AsyncSwell model. With the default
+    window of 0, ids loaded by every task before the loop yields are batched together.
+
+    Args:
+        model: model to load from, ie swell.products
+        window (optional): extra seconds to wait for more ids before dispatching a batch
+        params (optional): additional params for every request (ie expand)
+
+    """
+
+    def __init__(self, model: Base, window: float = 0, params: Optional[dict] = None):
+        self.model = model
+        self.window = window
+        self.params = params
+        self._pending = {}
+        # The event loop only keeps weak references to tasks, so running dispatches are held here
+        self._dispatches = set()
+
+    async def load(self, id: str) -> Optional[dict]:
+        """Loads an id, batched with the ids loaded by other tasks"""
+
+        if not id or not isinstance(id, str):
+            raise TypeError("id must be a non-empty string")
+
+        loop = asyncio.get_running_loop()
+
+        if not self._pending:
+            loop.call_later(self.window, self._schedule_dispatch)
+
+        future = self._pending.get(id)
+        if future is None:
+            future = self._pending[id] = loop.create_future()
+
+        return await asyncio.shield(future)
+
+    def _schedule_dispatch(self):
+        task = asyncio.ensure_future(self.dispatch())
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def dispatch(self):
+        """Fetches every pending id now"""
+
+        pending, self._pending = self._pending, {}
+
+        if not pending:
+            return
+
+        try:
+            records = await self.model.get_many(list(pending), self.params)
+        except Exception as error:
+            for future in pending.values():
+                future.set_exception(error)
+        else:
+            for id, future in pending.items():
+                future.set_result(records.get(id))
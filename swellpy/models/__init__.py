@@ -1,17 +1,32 @@
+from importlib import import_module
+
 from .base import Base
-from .accounts import Accounts
-from .carts import Carts
-from .products import Products
-from .coupons import Coupons
-from .promotions import Promotions
-from .giftcards import Giftcards
-from .categories import Categories
-from .attributes import Attributes
-from .purchase_links import PurchaseLinks
-from .invoices import Invoices
-from .events import Events
-from .subscriptions import Subscriptions
-from .payments import Payments
-from .returns import Returns
-from .shipments import Shipments
-from .webhooks import Webhooks
\ No newline at end of file
+
+# Model classes exported by this package, imported on first access
+_MODELS = {
+    'Accounts': '.accounts',
+    'Carts': '.carts',
+    'Products': '.products',
+    'Coupons': '.coupons',
+    'Promotions': '.promotions',
+    'Giftcards': '.giftcards',
+    'Categories': '.categories',
+    'Attributes': '.attributes',
+    'PurchaseLinks': '.purchase_links',
+    'Invoices': '.invoices',
+    'Events': '.events',
+    'Subscriptions': '.subscriptions',
+    'Payments': '.payments',
+    'Returns': '.returns',
+    'Shipments': '.shipments',
+    'Webhooks': '.webhooks',
+}
+
+__all__ = ['Base', *_MODELS]
+
+
+def __getattr__(name: str):
+    if name not in _MODELS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    return getattr(import_module(_MODELS[name], __name__), name)
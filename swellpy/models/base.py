@@ -1,6 +1,26 @@
-from ..utilities import handle_requests_response
-from typing import Optional
-from ratelimit import limits, sleep_and_retry
+import json
+import math
+import re
+
+from collections import deque
+from typing import Optional, Iterator, AsyncIterator, Iterable
+from urllib.parse import urlencode
+
+from ..streaming import ResultsParser
+from ..utilities import encode_params, diff_payload
+
+# Largest page size accepted by the Swell API
+MAX_PAGE_SIZE = 1000
+
+# Longest request URL sent when batching ids into a query, well below common server limits
+MAX_URL_LENGTH = 4096
+
+# Sort keys used by keyset pagination, unique and stable for every record
+KEYSET_FIELDS = ('date_created', 'id')
+
+# Field names accepted in a field selection, with dots for nested fields (ie items.product_id)
+FIELD_NAME = re.compile(r'^[A-Za-z0-9_$]+(\.[A-Za-z0-9_$]+)*$')
+
 
 class Base:
     """A set of common, public request methods from which all module-specific classes extend.
@@ -10,6 +30,8 @@ class Base:
     Args:
         Required fields (required): required fields for creating a new instance
         Endpoint: optional parameter to specify API endpoint, otherwise defaults to the model name.
+        Pagination: optional default strategy for iterate, 'page' (default) or 'keyset'.
+        Cacheable: optional, False to never cache responses (ie for feeds that must stay fresh).
 
     """
 
@@ -18,15 +40,79 @@ class Base:
         self.name = name
         self.endpoint = kwargs['endpoint'] if 'endpoint' in kwargs else self.name
         self.required_fields = kwargs['required_fields'] if 'required_fields' in kwargs else None
+        self.pagination = kwargs['pagination'] if 'pagination' in kwargs else 'page'
+        self.cacheable = kwargs['cacheable'] if 'cacheable' in kwargs else True
+
+    def _request(self, method: str, url: str, **kwargs):
+        """Sends a request for this model through the Swell client
+
+        The client applies its shared rate limit and response handling. With a Swell client
+        the handled JSON response is returned, while an AsyncSwell client returns a
+        coroutine resolving to it.
+        """
+        return self._swell._request(self, method, url, **kwargs)
+
+    def _list_url(self) -> str:
+        return f'{self._swell._base_url}/{self.endpoint}'
+
+    def _cache_tag(self, id: Optional[str] = None) -> str:
+        """Tag of this model's cached lists, or of a record's cached responses when id is given"""
+
+        tag = f'{self._swell._store_id}:{self.endpoint}'
+
+        return f'{tag}:{id}' if id else tag
+
+    def _cache_key(self, id: Optional[str], params: Optional[dict]) -> str:
+        return f'{self._cache_tag(id)}?{json.dumps(params or {}, sort_keys=True, default=str)}'
+
+    def _read(self, key: str, tags, fetch):
+        """Serves a read from the client cache, or fetches it once for all concurrent identical reads
+
+        Args:
+            key: cache key of the read
+            tags: function returning the cache tags of a response
+            fetch: function sending the request
+
+        """
+
+        ttl = self._swell.cache_ttl(self.name) if self.cacheable else 0
+        if ttl:
+            cached = self._swell.cache.get(key)
+            if cached is not None:
+                return self._swell._resolve(cached)
+
+            def store(response):
+                if response and isinstance(response, dict):
+                    self._swell.cache.set(key, response, ttl, tags(response))
+                return response
+
+            return self._swell._coalesce(key, lambda: self._swell._then(fetch(), store))
 
-        @sleep_and_retry
-        @limits(calls=self._swell.rate_limit_calls, period=self._swell.rate_limit_period)
-        def check_limit():
+        return self._swell._coalesce(key, fetch)
+
+    def _invalidate(self, result, id: Optional[str] = None):
+        """Drops cached lists, and cached responses for a record when id is given, once result completes"""
+
+        if self._swell.cache is None:
+            return result
+
+        def invalidate(response):
+            self.clear_cache(id)
+            return response
+
+        return self._swell._then(result, invalidate)
+
+    def clear_cache(self, id: Optional[str] = None):
+        """Drops this model's cached lists, and the cached responses of a record when id is given"""
+
+        if self._swell.cache is None:
             return
-        
-        self.check_limit = check_limit
 
-    def list(self, params: Optional[dict] = None) -> dict:
+        self._swell.cache.invalidate(self._cache_tag())
+        if id:
+            self._swell.cache.invalidate(self._cache_tag(id))
+
+    def list(self, params: Optional[dict] = None, fields: Optional[Iterable[str]] = None) -> dict:
         """Lists all items in the collection
 
         An object containing query parameters can be passed to filter the collection's results. In addition, 
@@ -36,20 +122,359 @@ class Base:
 
         Args:
             params
+            fields (optional): names of the fields to return for each item, id is always included
 
         Returns:
             JSON response, including results array and item count.
 
         """
-        self.check_limit()
 
-        response = self._swell._session.get(
-            url=f'{self._swell._base_url}/{self.endpoint}', params=params)
+        params = self._fields_params(params, fields)
+
+        return self._read(
+            self._cache_key(None, params),
+            lambda response: [self._cache_tag()],
+            lambda: self._request('get', self._list_url(), params=params))
+
+    def stream(self, params: Optional[dict] = None, fields: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """Lists items in the collection, yielding each one as it is parsed from the response
+
+        Unlike list, the response body is never held in memory as a whole: items of the
+        results array are decoded one at a time as the response arrives, which keeps
+        large pages (ie limit=1000 with expand) within a small memory budget. Streamed
+        responses are not cached.
+
+        Args:
+            params (optional): query parameters, as for list
+            fields (optional): names of the fields to return, as for list
+
+        Returns:
+            Iterator of the items of one page
+
+        """
+
+        if self._swell._is_async:
+            raise TypeError("Use astream with an AsyncSwell client")
+
+        return self._swell._stream(self, self._list_url(), self._fields_params(params, fields), ResultsParser())
+
+    def astream(self, params: Optional[dict] = None, fields: Optional[Iterable[str]] = None) -> AsyncIterator[dict]:
+        """Asynchronously lists items in the collection, yielding each one as it is parsed from the response
+
+        The AsyncSwell equivalent of stream.
+
+        Args:
+            params (optional): query parameters, as for list
+            fields (optional): names of the fields to return, as for list
+
+        Returns:
+            Async iterator of the items of one page
+
+        """
+
+        if not self._swell._is_async:
+            raise TypeError("Use stream with a Swell client")
+
+        return self._swell._stream(self, self._list_url(), self._fields_params(params, fields), ResultsParser())
+
+    def iterate(
+        self,
+        params: Optional[dict] = None,
+        page_size: int = 100,
+        pagination: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None
+    ) -> Iterator[dict]:
+        """Iterates over every item in the collection, across all pages
+
+        Pages are fetched lazily, one request at a time as the previous page is consumed,
+        so memory use stays flat regardless of the collection size. Iteration stops after
+        a page with fewer than page_size items or, with page pagination, once the pages
+        read cover the count of the response.
+
+        Two pagination strategies are available:
+            'page': walks page numbers, keeping any 'sort' in params
+            'keyset': walks the collection in (date_created, id) order, requesting items
+                after the last one seen. Each request is a cheap range query and the scan
+                is stable when records are created or deleted during iteration.
+
+        Args:
+            params (optional): query parameters, as for list. A 'page' starts page iteration from that page.
+            page_size (optional): number of items fetched per request, up to 1000
+            pagination (optional): 'page' or 'keyset', defaults to the model's pagination
+            stream (optional): parse each page incrementally as with stream, so at most one item is held in memory
+            fields (optional): names of the fields to return, as for list. Keyset fields are always included.
+
+        Returns:
+            Iterator of items
+
+        """
+
+        if self._swell._is_async:
+            raise TypeError("Use aiterate with an AsyncSwell client")
+
+        pagination = pagination or self.pagination
+        params = self._fields_params(params, fields, KEYSET_FIELDS if pagination == 'keyset' else ())
+        query = self._page_params(params, page_size, pagination)
+        params = query
+
+        while params is not None:
+            if stream:
+                parser = ResultsParser()
+                results, response = self._swell._stream(self, self._list_url(), params, parser), parser.meta
+            else:
+                response = self.list(params)
+                results = response.get('results', [])
+
+            size, last = 0, None
+            for last in results:
+                size += 1
+                yield last
+
+            params = self._next_page_params(query, params, pagination, size, last, response.get('count'))
+
+    async def aiterate(
+        self,
+        params: Optional[dict] = None,
+        page_size: int = 100,
+        pagination: Optional[str] = None,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[dict]:
+        """Asynchronously iterates over every item in the collection, across all pages
+
+        The AsyncSwell equivalent of iterate.
+
+        Args:
+            params (optional): query parameters, as for list. A 'page' starts page iteration from that page.
+            page_size (optional): number of items fetched per request, up to 1000
+            pagination (optional): 'page' or 'keyset', defaults to the model's pagination
+            stream (optional): parse each page incrementally as with astream
+            fields (optional): names of the fields to return, as for list
+
+        Returns:
+            Async iterator of items
+
+        """
+
+        if not self._swell._is_async:
+            raise TypeError("Use iterate with a Swell client")
+
+        pagination = pagination or self.pagination
+        params = self._fields_params(params, fields, KEYSET_FIELDS if pagination == 'keyset' else ())
+        query = self._page_params(params, page_size, pagination)
+        params = query
+
+        while params is not None:
+            size, last = 0, None
+            if stream:
+                parser = ResultsParser()
+                async for last in self._swell._stream(self, self._list_url(), params, parser):
+                    size += 1
+                    yield last
+                response = parser.meta
+            else:
+                response = await self.list(params)
+                for last in response.get('results', []):
+                    size += 1
+                    yield last
+
+            params = self._next_page_params(query, params, pagination, size, last, response.get('count'))
+
+    def list_all(
+        self,
+        params: Optional[dict] = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+        fields: Optional[Iterable[str]] = None
+    ) -> Iterator[dict]:
+        """Iterates over every item in the collection, fetching pages concurrently
+
+        The first page is fetched to read the item count, then the remaining pages are
+        requested by a pool of threads within the client's shared rate limit. Items are
+        yielded in page order, with at most `concurrency` pages fetched ahead. When the
+        response has no count, the remaining pages are fetched one at a time as with iterate.
+
+        Args:
+            params (optional): query parameters, as for list
+            page_size (optional): number of items fetched per request, up to 1000
+            concurrency (optional): number of pages fetched at once
+            fields (optional): names of the fields to return, as for list
+
+        Returns:
+            Iterator of items
+
+        """
+
+        if self._swell._is_async:
+            raise TypeError("Use alist_all with an AsyncSwell client")
+
+        params = self._page_params(self._fields_params(params, fields), page_size)
+        response = self.list(params)
+        yield from response.get('results', [])
+
+        pages = self._remaining_pages(response, params)
+        if pages is None:
+            yield from self.iterate({**params, 'page': params['page'] + 1}, page_size, 'page')
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            window = deque()
+            try:
+                for page in pages:
+                    window.append(executor.submit(self.list, {**params, 'page': page}))
+                    if len(window) >= concurrency:
+                        yield from window.popleft().result().get('results', [])
+
+                while window:
+                    yield from window.popleft().result().get('results', [])
+            finally:
+                for future in window:
+                    future.cancel()
+
+    async def alist_all(
+        self,
+        params: Optional[dict] = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+        fields: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[dict]:
+        """Asynchronously iterates over every item in the collection, fetching pages concurrently
+
+        The AsyncSwell equivalent of list_all.
+
+        Args:
+            params (optional): query parameters, as for list
+            page_size (optional): number of items fetched per request, up to 1000
+            concurrency (optional): number of pages fetched at once
+            fields (optional): names of the fields to return, as for list
+
+        Returns:
+            Async iterator of items
+
+        """
+
+        if not self._swell._is_async:
+            raise TypeError("Use list_all with a Swell client")
+
+        params = self._page_params(self._fields_params(params, fields), page_size)
+        response = await self.list(params)
+        for item in response.get('results', []):
+            yield item
+
+        pages = self._remaining_pages(response, params)
+        if pages is None:
+            async for item in self.aiterate({**params, 'page': params['page'] + 1}, page_size, 'page'):
+                yield item
+            return
+
+        import asyncio
+
+        window = deque()
+        try:
+            for page in pages:
+                window.append(asyncio.ensure_future(self.list({**params, 'page': page})))
+                if len(window) >= concurrency:
+                    for item in (await window.popleft()).get('results', []):
+                        yield item
+
+            while window:
+                for item in (await window.popleft()).get('results', []):
+                    yield item
+        finally:
+            for task in window:
+                task.cancel()
+
+    def _remaining_pages(self, response: dict, params: dict) -> Optional[range]:
+        """Pages left after the first response, or None when the count is unknown"""
+
+        if not self._has_next_page(params, len(response.get('results', [])), response.get('count')):
+            return range(0)
+        if response.get('count') is None:
+            return None
+
+        last_page = math.ceil(response['count'] / params['limit'])
+
+        return range(params['page'] + 1, last_page + 1)
+
+    @staticmethod
+    def _page_params(params: Optional[dict], page_size: int, pagination: str = 'page') -> dict:
+        if not isinstance(page_size, int) or not 0 < page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
+        params = dict(params or {})
+        params['limit'] = page_size
+
+        if pagination == 'page':
+            params.setdefault('page', 1)
+        elif pagination == 'keyset':
+            if 'sort' in params or 'page' in params:
+                raise ValueError("'sort' and 'page' cannot be used with keyset pagination")
+            params['sort'] = ', '.join(f'{key} asc' for key in KEYSET_FIELDS)
+        else:
+            raise ValueError("pagination must be 'page' or 'keyset'")
+
+        return params
+
+    @staticmethod
+    def _has_next_page(params: dict, size: int, count: Optional[int]) -> bool:
+        if size < params['limit']:
+            return False
+
+        return count is None or params['page'] * params['limit'] < count
+
+    def _next_page_params(
+        self,
+        query: dict,
+        params: dict,
+        pagination: str,
+        size: int,
+        last: Optional[dict],
+        count: Optional[int]
+    ) -> Optional[dict]:
+        """Params for the page following the current one, or None after the last page
+
+        Args:
+            query: params of the first page
+            params: params of the current page
+            pagination: 'page' or 'keyset'
+            size: number of items in the current page
+            last: last item of the current page
+            count: total item count from the current response, if any
+
+        """
+
+        if pagination == 'page':
+            if not self._has_next_page(params, size, count):
+                return None
+
+            return {**params, 'page': params['page'] + 1}
+
+        if size < params['limit']:
+            return None
 
-        return handle_requests_response(self._swell, response)
-        
+        missing = [key for key in KEYSET_FIELDS if key not in last]
+        if missing:
+            raise ValueError(f"Keyset pagination requires {', '.join(missing)} in each {self.name} result")
 
-    def get(self, id: str, params: Optional[dict] = None) -> dict:
+        after = self._keyset_after(last)
+        where = {'$and': [query['where'], after]} if query.get('where') else after
+
+        return {**query, 'where': where}
+
+    @staticmethod
+    def _keyset_after(last: dict) -> dict:
+        """Where filter matching items after last in keyset order"""
+
+        # Items sharing the last date_created are ordered by id
+        return {'$or': [
+            {'date_created': {'$gt': last['date_created']}},
+            {'date_created': last['date_created'], 'id': {'$gt': last['id']}},
+        ]}
+
+    def get(self, id: str, params: Optional[dict] = None, fields: Optional[Iterable[str]] = None) -> dict:
         """Retrieve a specific item in a collection
 
         An id (or slug if available) is passed to retrieve a specific item in a collection.
@@ -57,6 +482,7 @@ class Base:
         Args:
             id (string, required): id of the item in the collection.
             params (optional): additional params (ie expand)
+            fields (optional): names of the fields to return, id is always included
 
         Returns:
             JSON response for the item
@@ -68,12 +494,113 @@ class Base:
         elif not isinstance(id, str):
             raise TypeError("id must be a string")
 
-        self.check_limit()
+        params = self._fields_params(params, fields)
+
+        return self._read(
+            self._cache_key(id, params),
+            lambda response: [self._cache_tag(id), self._cache_tag(response.get('id'))],
+            lambda: self._request('get', f'{self._swell._base_url}/{self.endpoint}/{id}', params=params))
+
+    def get_many(
+        self,
+        ids: Iterable[str],
+        params: Optional[dict] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> dict:
+        """Retrieve many items in a collection by id with as few requests as possible
+
+        Ids are queried with an `id: {$in: [...]}` filter, split into chunks that fit the
+        page size and URL length limits. Ids found in the client cache are not requested.
+
+        Args:
+            ids (required): ids of the items to retrieve (slugs are not matched)
+            params (optional): additional params (ie expand)
+            fields (optional): names of the fields to return, id is always included
+
+        Returns:
+            Dict of items keyed by id, with None for ids that were not found
+
+        """
+
+        ids = list(dict.fromkeys(ids))
+        if not all(isinstance(id, str) and id for id in ids):
+            raise TypeError("ids must be non-empty strings")
+
+        params = self._fields_params(params, fields)
+        found = {}
+        ttl = self._swell.cache_ttl(self.name) if self.cacheable else 0
+        if ttl:
+            for id in ids:
+                cached = self._swell.cache.get(self._cache_key(id, params))
+                if cached is not None:
+                    found[id] = cached
+
+        missing = [id for id in ids if id not in found]
+        # Batches bypass the list cache, as their items are cached under their own get keys
+        pages = [
+            self._request('get', self._list_url(), params=self._ids_params(chunk, params))
+            for chunk in self._id_chunks(missing, params)]
+
+        def collect(responses):
+            for response in responses:
+                for item in response.get('results', []):
+                    found[item['id']] = item
+                    if ttl:
+                        self._swell.cache.set(
+                            self._cache_key(item['id'], params), item, ttl, [self._cache_tag(item['id'])])
+
+            return {id: found.get(id) for id in ids}
+
+        return self._swell._then(self._swell._gather(pages), collect)
+
+    @staticmethod
+    def _fields_params(params: Optional[dict], fields: Optional[Iterable[str]], required: Iterable[str] = ()) -> Optional[dict]:
+        """Adds a field selection to params, mapped to the API's comma-separated 'fields' parameter
+
+        Field names are validated, deduplicated and sorted so that equal selections share
+        cache entries. The id and any required fields are always selected.
+        """
+
+        if fields is None:
+            return params
+        if isinstance(fields, str):
+            raise TypeError("fields must be a list of field names")
 
-        response = self._swell._session.get(
-            url=f'{self._swell._base_url}/{self.endpoint}/{id}', params=params)
+        fields = list(fields)
+        invalid = [field for field in fields if not isinstance(field, str) or not FIELD_NAME.match(field)]
+        if invalid:
+            raise ValueError(f"Invalid field names: {', '.join(repr(field) for field in invalid)}")
+        if params and 'fields' in params:
+            raise ValueError("fields cannot be given both as an argument and in params")
 
-        return handle_requests_response(self._swell, response)
+        return {**(params or {}), 'fields': ','.join(sorted({'id', *required, *fields}))}
+
+    @staticmethod
+    def _ids_params(ids: list, params: Optional[dict]) -> dict:
+        params = dict(params or {})
+        where = {'id': {'$in': ids}}
+        params['where'] = {'$and': [params['where'], where]} if params.get('where') else where
+        params['limit'] = len(ids)
+
+        return params
+
+    def _id_chunks(self, ids: list, params: Optional[dict]) -> Iterator[list]:
+        """Splits ids into chunks whose list request fits the page size and URL length limits"""
+
+        base_length = len(f'{self._swell._base_url}/{self.endpoint}?') + len(
+            urlencode(encode_params(self._ids_params([], params)), doseq=True)) + len('&limit=1000')
+
+        chunk, length = [], base_length
+        for id in ids:
+            id_length = len(urlencode({f'where[$and][1][id][$in][{len(chunk)}]': id})) + 1
+            if chunk and (len(chunk) >= MAX_PAGE_SIZE or length + id_length > MAX_URL_LENGTH):
+                yield chunk
+                chunk, length = [], base_length
+            chunk.append(id)
+            length += id_length
+
+        if chunk:
+            yield chunk
 
     def create(self, payload: dict) -> dict:
         """Create a new item in the collection
@@ -85,48 +612,42 @@ class Base:
             JSON representation of the newly-created item with initiatlized fields
         """
 
-        if not payload:
-            raise ValueError("Payload must be provided")
+        self._validate_create(payload)
 
-        if self.required_fields:
-            for field in self.required_fields:
-                if not field in payload:
-                    raise ValueError(
-                        f"'{field}' must be provided to create a {self.name}")
-
-        self.check_limit()
-
-        response = self._swell._session.post(
-            url=f'{self._swell._base_url}/{self.endpoint}/', json=payload)
+        return self._invalidate(self._request(
+            'post', f'{self._swell._base_url}/{self.endpoint}/', json=payload))
 
-        return handle_requests_response(self._swell, response)
 
-
-    def update(self, payload: dict) -> dict:
+    def update(self, payload: dict, base: Optional[dict] = None, delta: bool = False) -> dict:
         """Update a specific item in the collection
 
+        In delta mode, the payload is compared with a snapshot of the item and only the
+        changed fields are sent. When nothing changed, no request is sent at all.
+
         Args:
             id: (string, required) id of the item in the collection to update
             payload: object containing the fields to update
+            base (optional): snapshot of the item to diff against, enables delta mode
+            delta (optional): diff against the cached item when base is not given
 
         Returns:
-            JSON representation of the updated item
+            JSON representation of the updated item (the snapshot when nothing changed)
 
         """
 
-        if not payload or 'id' not in payload:
-            raise Exception(f"id must be included for {self.name} update")
-        elif not isinstance(payload['id'], str):
-            raise TypeError("id must be a string")
+        self._validate_update(payload)
 
-        self.check_limit()
+        if base is None and delta and self._swell.cache is not None:
+            base = self._swell.cache.get(self._cache_key(payload['id'], None))
 
-        response = self._swell._session.put(
-            url=f'{self._swell._base_url}/{self.endpoint}/{payload["id"]}', json=payload)
+        if base is not None:
+            changes = diff_payload(payload, base)
+            if not changes:
+                return self._swell._resolve({**base, **payload})
+            payload = {'id': payload['id'], **changes}
 
-
-        return handle_requests_response(self._swell, response)
-        
+        return self._invalidate(self._request(
+            'put', f'{self._swell._base_url}/{self.endpoint}/{payload["id"]}', json=payload), payload['id'])
 
     def delete(self, id: str) -> dict:
         """Delete a specific item in the collection
@@ -138,14 +659,117 @@ class Base:
             JSON representation of the deleted item
         """
 
+        self._validate_delete(id)
+
+        return self._invalidate(self._request(
+            'delete', f'{self._swell._base_url}/{self.endpoint}/{id}'), id)
+
+    def create_many(self, payloads: list, concurrency: int = 4) -> list:
+        """Create many items in the collection concurrently
+
+        Every payload is validated before any request is sent. Requests then run
+        concurrently within the client's shared rate limit, and a failed item does
+        not stop the others.
+
+        Args:
+            payloads: list of objects, as for create
+            concurrency (optional): number of requests sent at once
+
+        Returns:
+            List of results in payload order, each a dict with the item 'index',
+            'ok', and either the JSON 'result' or the raised 'error'
+
+        """
+
+        self._validate_many(self._validate_create, payloads)
+
+        return self._many(self.create, payloads, concurrency)
+
+    def update_many(
+        self,
+        payloads: list,
+        concurrency: int = 4,
+        bases: Optional[dict] = None,
+        delta: bool = False
+    ) -> list:
+        """Update many items in the collection concurrently
+
+        Args:
+            payloads: list of objects including an id, as for update
+            concurrency (optional): number of requests sent at once
+            bases (optional): snapshots of the items keyed by id, to send only changed fields
+            delta (optional): diff against cached items without a snapshot in bases
+
+        Returns:
+            List of results in payload order, as for create_many
+
+        """
+
+        self._validate_many(self._validate_update, payloads)
+        bases = bases or {}
+
+        return self._many(
+            lambda payload: self.update(payload, bases.get(payload['id']), delta), payloads, concurrency)
+
+    def delete_many(self, ids: list, concurrency: int = 4) -> list:
+        """Delete many items in the collection concurrently
+
+        Args:
+            ids: list of ids of the items to delete
+            concurrency (optional): number of requests sent at once
+
+        Returns:
+            List of results in id order, as for create_many
+
+        """
+
+        self._validate_many(self._validate_delete, ids)
+
+        return self._many(self.delete, ids, concurrency)
+
+    def _validate_create(self, payload: dict):
+        if not payload:
+            raise ValueError("Payload must be provided")
+
+        if self.required_fields:
+            for field in self.required_fields:
+                if not field in payload:
+                    raise ValueError(
+                        f"'{field}' must be provided to create a {self.name}")
+
+    def _validate_update(self, payload: dict):
+        if not payload or 'id' not in payload:
+            raise Exception(f"id must be included for {self.name} update")
+        elif not isinstance(payload['id'], str):
+            raise TypeError("id must be a string")
+
+    def _validate_delete(self, id: str):
         if not id:
             raise ValueError(f"id must be included for {self.name} deletion")
         elif not isinstance(id, str):
             raise TypeError("id must be a string")
 
-        self.check_limit()
-
-        response = self._swell._session.delete(
-            url=f'{self._swell._base_url}/{self.endpoint}/{id}')
-
-        return handle_requests_response(self._swell, response)
+    @staticmethod
+    def _validate_many(validate, items: list):
+        """Validates every item, raising a ValueError describing all invalid items"""
+
+        errors = []
+        for index, item in enumerate(items):
+            try:
+                validate(item)
+            except Exception as error:
+                errors.append(f'{index}: {error}')
+
+        if errors:
+            raise ValueError(f"Invalid items, nothing was sent: {'; '.join(errors)}")
+
+    def _many(self, method, items: list, concurrency: int):
+        def results(outcomes):
+            return [
+                {'index': index, 'ok': False, 'result': None, 'error': outcome}
+                if isinstance(outcome, BaseException) else
+                {'index': index, 'ok': True, 'result': outcome, 'error': None}
+                for index, outcome in enumerate(outcomes)
+            ]
+
+        return self._swell._then(self._swell._map(method, items, concurrency), results)
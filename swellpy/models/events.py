@@ -13,7 +13,7 @@ class Events(Base):
 
     
     def __init__(self, swell):
-        super().__init__(swell, 'events')
+        super().__init__(swell, 'events', pagination='keyset', cacheable=False)
         
         self._swell = swell
 
@@ -12,7 +12,7 @@ class Orders(Base):
     For more information, see: https://developers.swell.is/backend-api/orders"""
 
     def __init__(self, swell):
-        super().__init__(swell, 'orders')
+        super().__init__(swell, 'orders', pagination='keyset')
         
         self._swell = swell
 
@@ -37,6 +37,4 @@ class Orders(Base):
         elif not isinstance(cart_id, str):
             raise TypeError("cart id must be a string")
 
-        response = self._swell._session.post(url=f'{self._swell._base_url}/orders/', params={"cart_id": cart_id})
-        
-        return response.json()
+        return self._request('post', f'{self._swell._base_url}/orders/', params={"cart_id": cart_id})
@@ -8,6 +8,6 @@ class ProductStock(Base):
     """
     
     def __init__(self, swell):
-        super().__init__(swell, 'stock', endpoint='products:stock', required_fields=['parent_id', 'quantity', 'message'])
+        super().__init__(swell, 'stock', endpoint='products:stock', required_fields=['parent_id', 'quantity', 'message'], pagination='keyset')
         
         self._swell = swell
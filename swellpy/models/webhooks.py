@@ -27,6 +27,4 @@ class Webhooks(Base):
         For more info, see: https://developers.swell.is/backend-api/webhooks/receiving-webhooks
         """
 
-        response = self._swell._session.get(url=f'{self._swell._base_url}/events:webhooks/', params=params)
-        
-        return response.json()
+        return self._request('get', f'{self._swell._base_url}/events:webhooks/', params=params)
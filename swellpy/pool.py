@@ -0,0 +1,196 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Callable, Mapping, Optional, Union
+
+from .cache import create_cache
+from .limiter import FileTokenBucket
+from .swell import Swell
+from .transport import create_adapter, create_httpx_transport, http2_available, transport_options
+
+
+class SwellPool:
+    """Hands out store-scoped Swell clients which share one connection pool
+
+    Each store gets its own client, with its own credentials, rate limit and cache
+    namespace, while all of them send requests through a single pool of connections
+    (and its DNS and TLS state). Clients are created on first use and the least
+    recently used ones are evicted beyond max_clients, or once idle for idle_timeout.
+
+    Args:
+        stores: store ids mapped to their API key (or to a dict with 'api_key' and store
+            specific 'options'), or a function returning either for a store id
+        options (optional): Swell options shared by every store. Connection options apply
+            to the shared pool. A "{store_id}" placeholder in "rate_limit_file" gives each
+            store its own file, and a "cache" is one backend shared by all stores.
+        max_clients (optional): number of store clients kept
+        idle_timeout (optional): seconds after which an unused client is evicted
+
+    """
+
+    _client_class = Swell
+
+    def __init__(
+        self,
+        stores: Union[Mapping[str, Union[str, dict]], Callable[[str], Union[str, dict]]],
+        options: Optional[dict] = None,
+        max_clients: int = 64,
+        idle_timeout: Optional[float] = None
+    ):
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+
+        self.stores = stores
+        self.options = dict(options or {})
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+
+        if "cache" in self.options:
+            cache = self.options["cache"]
+            self.options["cache"] = {**cache, "backend": create_cache(cache)}
+
+        self.options.update(self._create_transport())
+
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _create_transport(self) -> dict:
+        """Creates the connection pool shared by every store, as Swell options"""
+
+        if transport_options(self.options)['http2'] and http2_available():
+            import httpx
+
+            return {"transport": create_httpx_transport(httpx.HTTPTransport, self.options, http2=True)}
+
+        return {"http_adapter": create_adapter(self.options)}
+
+    def get(self, store_id: str) -> Swell:
+        """Returns the client of a store, creating it on first use"""
+
+        if not store_id or not isinstance(store_id, str):
+            raise TypeError("store_id must be a non-empty string")
+
+        with self._lock:
+            now = time.monotonic()
+            self._evict_idle(now)
+
+            entry = self._clients.get(store_id)
+            if entry is None:
+                entry = self._clients[store_id] = [self._create_client(store_id), now]
+                while len(self._clients) > self.max_clients:
+                    self._release(self._clients.popitem(last=False)[1][0])
+            else:
+                entry[1] = now
+                self._clients.move_to_end(store_id)
+
+            return entry[0]
+
+    def __getitem__(self, store_id: str) -> Swell:
+        return self.get(store_id)
+
+    def __contains__(self, store_id: str) -> bool:
+        return store_id in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def evict(self, store_id: str):
+        """Drops the client of a store, which is recreated on next use"""
+
+        with self._lock:
+            entry = self._clients.pop(store_id, None)
+            if entry is not None:
+                self._release(entry[0])
+
+    def _evict_idle(self, now: float):
+        if self.idle_timeout is None:
+            return
+
+        # Clients are ordered from least to most recently used
+        while self._clients:
+            store_id, (client, used) = next(iter(self._clients.items()))
+            if now - used < self.idle_timeout:
+                break
+            del self._clients[store_id]
+            self._release(client)
+
+    def _release(self, client: Swell):
+        """Closes what a dropped client holds on its own, leaving its shared connections open"""
+
+        if isinstance(client.limiter, FileTokenBucket):
+            client.limiter.close()
+
+    def _clear(self):
+        with self._lock:
+            for client, used in self._clients.values():
+                self._release(client)
+            self._clients.clear()
+
+    def _create_client(self, store_id: str) -> Swell:
+        store = self.stores(store_id) if callable(self.stores) else self.stores.get(store_id)
+        if store is None:
+            raise KeyError(f"Unknown store: {store_id}")
+
+        if isinstance(store, str):
+            store = {"api_key": store}
+
+        options = {**self.options, **store.get("options", {})}
+        if "rate_limit_file" in options:
+            options["rate_limit_file"] = options["rate_limit_file"].format(store_id=store_id)
+
+        # Evicted clients are dropped without being closed, as their connections are shared
+        return self._client_class({"store_id": store_id, "api_key": store["api_key"], "options": options})
+
+    def close(self):
+        """Drops every client and closes the shared connections"""
+
+        self._clear()
+
+        if "transport" in self.options:
+            self.options["transport"].close()
+        else:
+            self.options["http_adapter"].close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncSwellPool(SwellPool):
+    """Hands out store-scoped AsyncSwell clients which share one connection pool
+
+    The asyncio equivalent of SwellPool, whose clients share one httpx transport.
+
+    """
+
+    def _create_transport(self) -> dict:
+        import httpx
+
+        http2 = transport_options(self.options)['http2'] and http2_available()
+
+        return {"transport": create_httpx_transport(httpx.AsyncHTTPTransport, self.options, http2=http2)}
+
+    @property
+    def _client_class(self):
+        from .async_swell import AsyncSwell
+
+        return AsyncSwell
+
+    def close(self):
+        raise TypeError("Use aclose with an AsyncSwellPool")
+
+    async def aclose(self):
+        """Drops every client and closes the shared connections"""
+
+        self._clear()
+
+        await self.options["transport"].aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -0,0 +1,102 @@
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried
+
+    Requests failing with a retryable status or a connection error are retried with
+    jittered exponential backoff, unless the response provides a Retry-After header,
+    which is honored up to max_retry_after; a longer wait fails the request instead, as
+    it would hold back the whole client. POST requests are not idempotent, so by default
+    they are only retried on 429 (the request was rejected before being processed).
+
+    Args:
+        max_attempts: total number of attempts per request, 1 disables retries
+        backoff: base delay in seconds, doubled after each attempt
+        max_backoff: upper bound for the computed backoff delay
+        max_retry_after: longest Retry-After in seconds waited for before retrying
+        jitter: randomize delays to avoid synchronized retries
+        statuses: HTTP statuses that are retried
+        retry_non_idempotent: also retry POST requests on server and connection errors
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        max_retry_after: float = 60,
+        jitter: bool = True,
+        statuses: tuple = (429, 500, 502, 503, 504),
+        retry_non_idempotent: bool = False
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.statuses = statuses
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def next_delay(self, method: str, attempt: int, response=None) -> Optional[float]:
+        """Returns seconds to wait before retrying, or None if the request should not be retried
+
+        Args:
+            method: HTTP method of the request
+            attempt: number of the attempt that just failed, starting at 1
+            response (optional): the failed response, or None for a connection error
+
+        """
+
+        if attempt >= self.max_attempts:
+            return None
+
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            if response.status_code != 429 and not self._idempotent(method):
+                return None
+
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+        elif not self._idempotent(method):
+            return None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _idempotent(self, method: str) -> bool:
+        return self.retry_non_idempotent or method.lower() != 'post'
+
+    @staticmethod
+    def retry_after(response) -> Optional[float]:
+        """Parses the Retry-After header in seconds or HTTP-date form"""
+
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def is_throttled(response) -> bool:
+        """Whether the response asks the client to slow down"""
+
+        return response is not None and (
+            response.status_code == 429 or 'Retry-After' in response.headers)
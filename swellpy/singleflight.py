@@ -0,0 +1,70 @@
+import copy
+import threading
+
+from concurrent.futures import Future
+from typing import Callable, Hashable
+
+
+class SingleFlight:
+    """Shares one in-flight call between threads making the same call
+
+    While a call for a key is running, other callers with the same key wait for it
+    and receive a copy of its result (or its exception) instead of making their own.
+
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable):
+        """Calls fn, unless a call for key is already in flight, then waits for its result"""
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+
+        if not leader:
+            return copy.deepcopy(call.result())
+
+        try:
+            result = fn()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Shares one in-flight coroutine between tasks making the same call
+
+    The asyncio equivalent of SingleFlight.
+
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key: Hashable, fn: Callable):
+        """Awaits fn(), unless a call for key is already in flight, then waits for its result"""
+
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is not None:
+            # Shielded so a cancelled follower does not cancel the shared request
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = self._calls[key] = asyncio.ensure_future(fn())
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if self._calls.get(key) is task:
+                del self._calls[key]
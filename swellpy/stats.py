@@ -0,0 +1,169 @@
+import math
+import threading
+import time
+
+from typing import Optional
+
+
+class Histogram:
+    """Fixed-size histogram of positive values with logarithmic buckets (HDR-style)
+
+    Values are counted in buckets whose bounds grow by a constant factor, so every
+    percentile is reported within `precision` relative error while memory stays bounded
+    by the number of buckets, however many values are recorded. Values outside
+    [lowest, highest] are counted in the first or last bucket.
+
+    Args:
+        lowest (optional): smallest value tracked precisely, ie 1 microsecond
+        highest (optional): largest value tracked precisely, ie 1 hour
+        precision (optional): relative error of reported percentiles
+
+    """
+
+    def __init__(self, lowest: float = 1e-6, highest: float = 3600, precision: float = 0.01):
+        self.lowest = lowest
+        self._growth = math.log1p(2 * precision)
+        self._buckets = math.ceil(math.log(highest / lowest) / self._growth) + 1
+        self.reset()
+
+    def reset(self):
+        self._counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value: float):
+        if value <= self.lowest:
+            bucket = 0
+        else:
+            bucket = min(int(math.log(value / self.lowest) / self._growth), self._buckets - 1)
+
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Value below which `percent` of the recorded values fall, None when empty"""
+
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                break
+
+        # Values out of range are only bounded by the extremes recorded
+        if bucket == 0:
+            return self.min
+        if bucket == self._buckets - 1:
+            return self.max
+
+        # The geometric middle of the bucket is within precision of any value in it
+        value = self.lowest * math.exp((bucket + 0.5) * self._growth)
+
+        return min(max(value, self.min), self.max)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class StatsCollector:
+    """Aggregates request events into per-endpoint counts, error rates and latency percentiles
+
+    A StatsCollector is a request hook (see Swell.add_hook). Memory is bounded by the
+    number of distinct endpoints, not the number of requests. Latency is the API's: the
+    time from sending a request's final attempt to receiving its response headers, which
+    excludes rate limiter waits, earlier attempts, decoding and the time spent consuming
+    streamed items.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._since = time.time()
+
+    def __call__(self, event: dict):
+        key = f"{event['method']} {event['endpoint']}"
+        failed = event['error'] is not None or (event['status'] or 0) >= 400
+
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = {
+                    'count': 0, 'errors': 0, 'bytes': 0, 'retries': 0, 'limiter_wait': 0.0, 'latency': Histogram()}
+
+            stats['count'] += 1
+            stats['errors'] += failed
+            stats['bytes'] += event['bytes']
+            stats['retries'] += event['retries']
+            stats['limiter_wait'] += event['limiter_wait']
+            # Requests failing before they are sent have no latency
+            if event['latency'] is not None:
+                stats['latency'].record(event['latency'])
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """Summarizes the requests recorded since the collector was created or last reset
+
+        Args:
+            reset (optional): start a new period after taking the snapshot
+
+        Returns:
+            Dict with the period 'since' (epoch seconds) and 'elapsed' seconds, the total
+            'requests', 'errors' and 'throughput' (requests per second), and 'endpoints'
+            keyed by method and endpoint (ie 'GET products'), each with its count, errors,
+            error_rate, bytes, retries, limiter_wait and p50, p95, p99, mean and max
+            latency in seconds (None when no request was sent)
+
+        """
+
+        with self._lock:
+            now = time.time()
+            endpoints = {key: self._summary(stats) for key, stats in self._endpoints.items()}
+            since = self._since
+            if reset:
+                self._endpoints = {}
+                self._since = now
+
+        requests = sum(stats['count'] for stats in endpoints.values())
+        errors = sum(stats['errors'] for stats in endpoints.values())
+        elapsed = now - since
+
+        return {
+            'since': since,
+            'elapsed': elapsed,
+            'requests': requests,
+            'errors': errors,
+            'throughput': requests / elapsed if elapsed > 0 else 0.0,
+            'endpoints': endpoints,
+        }
+
+    def reset(self):
+        """Starts a new period, discarding everything recorded"""
+
+        self.snapshot(reset=True)
+
+    @staticmethod
+    def _summary(stats: dict) -> dict:
+        latency = stats['latency']
+
+        return {
+            'count': stats['count'],
+            'errors': stats['errors'],
+            'error_rate': stats['errors'] / stats['count'],
+            'bytes': stats['bytes'],
+            'retries': stats['retries'],
+            'limiter_wait': stats['limiter_wait'],
+            'p50': latency.percentile(50),
+            'p95': latency.percentile(95),
+            'p99': latency.percentile(99),
+            'mean': latency.mean,
+            'max': latency.max,
+        }
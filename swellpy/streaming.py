@@ -0,0 +1,272 @@
+import codecs
+import re
+
+from typing import Iterable, Iterator, AsyncIterable, AsyncIterator, Optional
+
+from . import codec
+
+_WHITESPACE = ' \t\n\r'
+
+# Body of a JSON string up to its closing quote, or up to an escape split across chunks
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# A complete JSON string
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+# Anything but brackets, and a pair of brackets with nothing between them
+_NOT_BRACKET = re.compile(r'[^{}\[\]]+')
+_BRACKET_PAIR = re.compile(r'\{\}|\[\]')
+
+# Characters ending a scalar value (ie a number)
+_SCALAR_END = re.compile(r'[,\]}\s]')
+
+
+class ResultsParser:
+    """Incrementally parses a JSON list response, returning items of its results array as they complete
+
+    Only the item being parsed is buffered, so memory stays flat however large the
+    page is. Other top-level fields (ie count, page) are collected in `meta`. The end
+    of a value is found by scanning each chunk once, then the value is decoded once.
+
+    Args:
+        key (optional): name of the array whose items are returned
+
+    """
+
+    def __init__(self, key: str = 'results'):
+        self.key = key
+        self.meta = {}
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._state = 'start'
+        self._field = None
+        self._reset_scan()
+
+    def _reset_scan(self):
+        # Progress through the value at the start of the buffer, kept between chunks
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: bytes) -> list:
+        """Parses a chunk of the response body, returning the items completed by it"""
+
+        self._buffer += self._text.decode(chunk)
+
+        items = []
+        position = self._parse(items)
+        self._buffer = self._buffer[position:]
+
+        return items
+
+    def close(self):
+        """Checks the whole response was parsed, raising ValueError when it was truncated or invalid"""
+
+        self._buffer += self._text.decode(b'', final=True)
+        self._parse([])
+
+        if self._state != 'end' or self._buffer.strip(_WHITESPACE):
+            raise ValueError("Incomplete or invalid JSON list response")
+
+    def _parse(self, items: list) -> int:
+        """Consumes complete tokens from the buffer, returning the position parsing stopped at"""
+
+        buffer = self._buffer
+        position = 0
+
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position >= len(buffer):
+                return position
+
+            char = buffer[position]
+            state = self._state
+
+            if state == 'start':
+                if char != '{':
+                    raise ValueError("Expected a JSON object response")
+                position += 1
+                self._state = 'field'
+            elif state == 'field':
+                if char == '}':
+                    position += 1
+                    self._state = 'end'
+                    continue
+                decoded = self._decode(buffer, position)
+                if decoded is None:
+                    return position
+                self._field, position = decoded
+                self._state = 'colon'
+            elif state == 'colon':
+                if char != ':':
+                    raise ValueError("Expected ':' in JSON object")
+                position += 1
+                self._state = 'value'
+            elif state == 'value':
+                if self._field == self.key and char == '[':
+                    position += 1
+                    self._state = 'item'
+                    continue
+                decoded = self._decode(buffer, position)
+                if decoded is None:
+                    return position
+                self.meta[self._field], position = decoded
+                self._state = 'next_field'
+            elif state == 'next_field':
+                if char not in ',}':
+                    raise ValueError("Expected ',' or '}' in JSON object")
+                position += 1
+                self._state = 'field' if char == ',' else 'end'
+            elif state in ('item', 'next_item'):
+                if char == ']':
+                    position += 1
+                    self._state = 'next_field'
+                    continue
+                if state == 'next_item':
+                    if char != ',':
+                        raise ValueError("Expected ',' or ']' in JSON array")
+                    position += 1
+                    self._state = 'item'
+                    continue
+                decoded = self._decode(buffer, position)
+                if decoded is None:
+                    return position
+                item, position = decoded
+                items.append(item)
+                self._state = 'next_item'
+            else:
+                raise ValueError("Unexpected data after JSON response")
+
+    def _decode(self, buffer: str, position: int):
+        """Decodes the JSON value at position, or returns None when it is not complete yet"""
+
+        end = self._value_end(buffer, position)
+        if end is None:
+            return None
+
+        self._reset_scan()
+
+        return codec.loads(buffer[position:end]), end
+
+    def _value_end(self, buffer: str, position: int) -> Optional[int]:
+        """Finds where the value at position ends, resuming the scan of previous chunks
+
+        Brackets are counted with str methods between strings, so the loop runs once per
+        string rather than once per character.
+        """
+
+        if not self._scanned and buffer[position] not in '"{[':
+            # A scalar running to the end of the buffer may continue in the next chunk (ie a number)
+            match = _SCALAR_END.search(buffer, position)
+            return match.start() if match else None
+
+        index = position + self._scanned
+        length = len(buffer)
+        resumed = self._scanned > 0
+
+        while True:
+            if self._in_string:
+                index = _STRING_BODY.match(buffer, index).end()
+                if index >= length or buffer[index] != '"':
+                    self._scanned = index - position
+                    return None
+                index += 1
+                self._in_string = False
+                if not self._depth:
+                    return index
+
+            if resumed:
+                resumed = False
+                if self._skip(buffer, index):
+                    self._scanned = (buffer.rfind('"') + 1 if self._in_string else length) - position
+                    return None
+
+            quote = buffer.find('"', index)
+            end = quote if quote != -1 else length
+            closing = buffer.count('}', index, end) + buffer.count(']', index, end)
+
+            if closing < self._depth:
+                self._depth += buffer.count('{', index, end) + buffer.count('[', index, end) - closing
+            else:
+                # The value may end before the next string
+                for offset, char in enumerate(buffer[index:end], index):
+                    if char in '{[':
+                        self._depth += 1
+                    elif char in '}]':
+                        self._depth -= 1
+                        if not self._depth:
+                            return offset + 1
+
+            if quote == -1:
+                self._scanned = length - position
+                return None
+
+            index = quote + 1
+            self._in_string = True
+
+    def _skip(self, buffer: str, index: int) -> bool:
+        """Skips the rest of the buffer when the value does not end in it, without looping over its strings
+
+        Without strings and matching pairs of brackets, the data is a run of closing
+        brackets then opening ones, which tell whether the value is closed.
+        """
+
+        text = _STRING.sub('', buffer[index:])
+        # Any quote left opens a string which continues in the next chunk
+        quote = text.find('"')
+        text = _NOT_BRACKET.sub('', text if quote == -1 else text[:quote])
+
+        removed = True
+        while removed:
+            text, removed = _BRACKET_PAIR.subn('', text)
+
+        closing = len(text) - len(text.lstrip('}]'))
+        if closing >= self._depth:
+            return False
+
+        self._depth += len(text) - 2 * closing
+        # Quotes after the opening one of a string left open are escaped, so it is resumed after the last
+        self._in_string = quote != -1
+
+        return True
+
+
+def counted(chunks: Iterable[bytes], event: Optional[dict]) -> Iterator[bytes]:
+    """Passes chunks through, adding their size to the event's bytes when there is an event"""
+
+    if event is None:
+        yield from chunks
+        return
+
+    for chunk in chunks:
+        event['bytes'] += len(chunk)
+        yield chunk
+
+
+async def acounted(chunks: AsyncIterable[bytes], event: Optional[dict]) -> AsyncIterator[bytes]:
+    """Passes chunks through, adding their size to the event's bytes when there is an event"""
+
+    async for chunk in chunks:
+        if event is not None:
+            event['bytes'] += len(chunk)
+        yield chunk
+
+
+def iter_results(chunks: Iterable[bytes], parser: ResultsParser) -> Iterator[dict]:
+    """Yields the results items of a response body read in chunks"""
+
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+    parser.close()
+
+
+async def aiter_results(chunks: AsyncIterable[bytes], parser: ResultsParser) -> AsyncIterator[dict]:
+    """Yields the results items of a response body read asynchronously in chunks"""
+
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+
+    parser.close()
@@ -0,0 +1,151 @@
+from typing import Optional
+
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait for a connection to the API to be established
+DEFAULT_CONNECT_TIMEOUT = 10
+
+# Seconds to wait for the API between bytes of a response
+DEFAULT_READ_TIMEOUT = 60
+
+# Connections kept open to the API by a client
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+def transport_options(options: dict) -> dict:
+    """Reads the connection pool and timeout settings from Swell options
+
+    Returns:
+        Dict with max_connections, pool_block, keep_alive, connect_timeout, read_timeout and http2
+    """
+
+    return {
+        'max_connections': options.get('max_connections', DEFAULT_MAX_CONNECTIONS),
+        'pool_block': options.get('pool_block', False),
+        'keep_alive': options.get('keep_alive', True),
+        'connect_timeout': options.get('connect_timeout', DEFAULT_CONNECT_TIMEOUT),
+        'read_timeout': options.get('read_timeout', DEFAULT_READ_TIMEOUT),
+        'http2': options.get('http2', False),
+    }
+
+
+def http2_available() -> bool:
+    """Whether httpx and its HTTP/2 support (h2) are installed"""
+
+    try:
+        import httpx
+        import h2
+    except ImportError:
+        return False
+
+    return True
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default timeout to requests sent without one
+
+    Args:
+        timeout: (connect, read) timeout in seconds, None to wait indefinitely
+        Other arguments are passed to HTTPAdapter (ie pool_maxsize, pool_block)
+
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['timeout']
+
+    def __init__(self, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+
+        return super().send(request, **kwargs)
+
+
+def create_adapter(options: dict) -> TimeoutHTTPAdapter:
+    """Creates the pooled HTTP adapter of a Swell session from its options"""
+
+    settings = transport_options(options)
+
+    return TimeoutHTTPAdapter(
+        timeout=(settings['connect_timeout'], settings['read_timeout']),
+        pool_maxsize=settings['max_connections'],
+        pool_block=settings['pool_block'])
+
+
+def _httpx_limits(settings: dict):
+    import httpx
+
+    return httpx.Limits(
+        max_connections=settings['max_connections'],
+        max_keepalive_connections=settings['max_connections'] if settings['keep_alive'] else 0)
+
+
+def create_httpx_transport(transport_class, options: dict, http2: bool = False):
+    """Creates an httpx connection pool (httpx.HTTPTransport or httpx.AsyncHTTPTransport) from Swell options
+
+    A transport can be shared by several clients with the "transport" option.
+    """
+
+    return transport_class(limits=_httpx_limits(transport_options(options)), http2=http2)
+
+
+def create_httpx_client(client_class, options: dict, auth: tuple, headers: Optional[dict] = None, http2: bool = False):
+    """Creates a pooled httpx client (httpx.Client or httpx.AsyncClient) from Swell options
+
+    With a "transport" option, the client sends its requests through that shared
+    transport, whose own pool settings apply.
+    """
+
+    import httpx
+
+    settings = transport_options(options)
+    # Waiting for a pooled connection is bounded by the requests in flight, not a timeout
+    timeout = httpx.Timeout(
+        settings['read_timeout'], connect=settings['connect_timeout'], pool=None)
+
+    if options.get('transport') is not None:
+        return client_class(auth=auth, timeout=timeout, headers=headers, transport=options['transport'])
+
+    return client_class(
+        auth=auth, limits=_httpx_limits(settings), timeout=timeout, headers=headers, http2=http2)
+
+
+class HTTP2Session:
+    """Sends the requests of a Swell client over HTTP/2 with an httpx.Client
+
+    Provides the part of the requests.Session interface used by Swell, returning
+    httpx responses. Many requests are multiplexed over each connection.
+
+    Args:
+        client: httpx.Client created with http2=True
+
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def request(self, method: str, url: str, stream: bool = False, **kwargs):
+        request = self.client.build_request(method.upper(), url, **kwargs)
+
+        return self.client.send(request, stream=stream)
+
+    def get(self, url: str, **kwargs):
+        return self.request('get', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('post', url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request('put', url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request('delete', url, **kwargs)
+
+    def close(self):
+        self.client.close()
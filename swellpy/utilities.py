@@ -1,38 +1,108 @@
-import json
+import logging
+
+from datetime import date
 
-from requests import Response
 from requests.exceptions import HTTPError
 
+from . import codec
+
+
+def encode_params(params: dict) -> dict:
+    """Flattens nested query parameters into bracket notation
+
+    Swell parses nested queries such as {'where': {'id': {'$in': ['a', 'b']}}} from
+    keys like where[id][$in][0]=a. Top-level values are left for the HTTP client to encode.
+    """
+
+    if not params:
+        return params
+
+    encoded = {}
+
+    def flatten(prefix, value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                flatten(f'{prefix}[{key}]', item)
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                flatten(f'{prefix}[{index}]', item)
+        elif isinstance(value, bool):
+            encoded[prefix] = 'true' if value else 'false'
+        elif isinstance(value, date):
+            encoded[prefix] = value.isoformat()
+        elif value is None:
+            encoded[prefix] = ''
+        else:
+            encoded[prefix] = value
+
+    for key, value in params.items():
+        if isinstance(value, dict) or (
+                isinstance(value, (list, tuple)) and any(isinstance(item, (dict, list, tuple)) for item in value)):
+            flatten(key, value)
+        elif isinstance(value, date):
+            encoded[key] = value.isoformat()
+        else:
+            encoded[key] = value
+
+    return encoded
+
+
+def diff_payload(payload: dict, base: dict) -> dict:
+    """Returns the fields of payload whose values differ from base, excluding the id
+
+    Fields are compared as a whole, so a changed nested object or array is sent entirely.
+    """
+
+    return {
+        key: value for key, value in payload.items()
+        if key != 'id' and (key not in base or base[key] != value)
+    }
+
+
+def decode_response(res):
+    """Decodes a JSON response body with the fastest available codec
+
+    Response objects that do not expose their raw body are decoded with their own json().
+    """
+
+    content = getattr(res, 'content', None)
+    if isinstance(content, (bytes, str)):
+        return codec.loads(content)
+
+    return res.json()
+
 
-def response_formatter(res: Response) -> str:
-    method = res.request.method
-    url = res.url
-    status = res.status_code
-    msg = f'{method} {url} [HTTP {status}'
+def log_response(swell, res):
+    """Logs the request line of a response at debug level, only formatting it when debug is enabled"""
 
-    return msg
+    if swell.logger.isEnabledFor(logging.DEBUG):
+        swell.logger.debug('%s %s [HTTP %s]', res.request.method, res.url, res.status_code)
 
 
-def handle_requests_response(swell, res):
+def handle_requests_response(swell, res, log: bool = True):
 
-    if not res:
+    # requests responses are falsy for 4xx and 5xx statuses, which are handled below
+    if res is None:
         raise Exception("No response received")
 
-    swell.logger.debug(response_formatter(res))
+    if log:
+        log_response(swell, res)
 
     if res.status_code == 200:
         jsonRes = {}
 
         try:
-            jsonRes = res.json()
-        except json.JSONDecodeError:
+            jsonRes = decode_response(res)
+        except ValueError:
             swell.logger.debug(
-                f'Response could not be serialized. Check if record exists.')
+                'Response could not be serialized. Check if record exists.')
 
-        if 'errors' in jsonRes:
+        if 'errors' in jsonRes and swell.logger.isEnabledFor(logging.DEBUG):
             swell.logger.debug(jsonRes['errors'])
 
     else:
-        raise HTTPError(f'HTTP Error {res.status_code}: {res.reason}')
+        # requests exposes the status text as `reason`, httpx as `reason_phrase`
+        reason = getattr(res, 'reason', None) or getattr(res, 'reason_phrase', '')
+        raise HTTPError(f'HTTP Error {res.status_code}: {reason}')
 
     return jsonRes
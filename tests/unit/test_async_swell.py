@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+from requests.exceptions import HTTPError
+from swellpy import AsyncSwell, codec
+
+
+class TestAsyncSwell(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        class SessionMock:
+            def __init__(self):
+                self.get = AsyncMock()
+                self.put = AsyncMock()
+                self.post = AsyncMock()
+                self.delete = AsyncMock()
+                self.aclose = AsyncMock()
+
+                for method in (self.get, self.put, self.post, self.delete):
+                    method.return_value = MagicMock(status_code=200)
+                    method.return_value.json.return_value = {'id': 'abc123'}
+
+        global swell
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        swell._session = SessionMock()
+        swell._base_url = 'https://store_id:api_key'
+
+    async def test_list_returns_coroutine(self):
+        """Tests model methods return coroutines resolving to the JSON response"""
+
+        pending = swell.products.list({'limit': 1})
+
+        assert asyncio.iscoroutine(pending)
+        assert await pending == {'id': 'abc123'}
+        swell._session.get.assert_called_once_with(url='https://store_id:api_key/products', params={'limit': 1})
+
+    async def test_update_method(self):
+        """Tests update is sent through the async session"""
+
+        payload = {'id': 'abc123', 'name': 'test'}
+        await swell.products.update(payload)
+        swell._session.put.assert_called_once_with(url='https://store_id:api_key/products/abc123', content=codec.dumps(payload), headers={'Content-Type': 'application/json'})
+
+    async def test_custom_model_method(self):
+        """Tests custom model methods are mirrored"""
+
+        await swell.orders.convert_cart_to_order('cart123')
+        swell._session.post.assert_called_once_with(url='https://store_id:api_key/orders/', params={'cart_id': 'cart123'})
+
+    async def test_concurrent_requests(self):
+        """Tests many requests can be gathered on one event loop"""
+
+        results = await asyncio.gather(*[swell.products.get(f'id{i}') for i in range(20)])
+
+        assert len(results) == 20
+        assert swell._session.get.call_count == 20
+
+    async def test_validation_raises_before_request(self):
+        """Tests Base validation is shared and raised immediately"""
+
+        with self.assertRaises(TypeError):
+            swell.products.get(123)
+
+        swell._session.get.assert_not_called()
+
+    async def test_error_response(self):
+        """Tests error responses are handled like the sync client"""
+
+        swell._session.get.return_value = MagicMock(status_code=404, reason=None, reason_phrase='Not Found')
+
+        with self.assertRaises(HTTPError):
+            await swell.products.get('missing')
+
+    async def test_aiterate_across_pages(self):
+        """Tests aiterate yields items from every page"""
+
+        pages = [{'count': 3, 'results': [{'id': '1'}, {'id': '2'}]}, {'count': 3, 'results': [{'id': '3'}]}]
+        responses = [MagicMock(status_code=200) for page in pages]
+        for response, page in zip(responses, pages):
+            response.json.return_value = page
+        swell._session.get.side_effect = responses
+
+        items = [item['id'] async for item in swell.products.aiterate(page_size=2)]
+
+        assert items == ['1', '2', '3']
+        swell._session.get.assert_called_with(url='https://store_id:api_key/products', params={'limit': 2, 'page': 2})
+
+    async def test_alist_all_fetches_pages_concurrently(self):
+        """Tests alist_all yields every page in order"""
+
+        def get_page(url, params):
+            start = (params['page'] - 1) * params['limit']
+            response = MagicMock(status_code=200)
+            response.json.return_value = {
+                'count': 5, 'results': [{'id': str(i)} for i in range(start, min(start + params['limit'], 5))]}
+            return response
+
+        swell._session.get.side_effect = get_page
+
+        items = [item['id'] async for item in swell.products.alist_all(page_size=2, concurrency=2)]
+
+        assert items == ['0', '1', '2', '3', '4']
+        assert swell._session.get.call_count == 3
+
+    async def test_bulk_methods(self):
+        """Tests bulk methods run concurrently and report per-item results"""
+
+        swell._session.delete.side_effect = [MagicMock(status_code=200), MagicMock(status_code=404, reason='Not Found')]
+        swell.retry.max_attempts = 1
+
+        results = await swell.products.delete_many(['a', 'b'], concurrency=2)
+
+        assert [result['ok'] for result in results] == [True, False]
+        assert isinstance(results[1]['error'], HTTPError)
+
+    async def test_iterate_requires_sync_client(self):
+        """Tests the sync iterator is rejected on an async client"""
+
+        with self.assertRaises(TypeError):
+            next(swell.orders.iterate())
+
+    async def test_context_manager_closes_session(self):
+        """Tests the client closes its session on exit"""
+
+        async with swell:
+            pass
+
+        swell._session.aclose.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
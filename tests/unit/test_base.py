@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock
 from swellpy.models.base import Base
+from swellpy import Swell, codec
+from requests.exceptions import HTTPError
 import logging
 class TestBaseClass(unittest.TestCase):
 
@@ -20,18 +22,14 @@ class TestBaseClass(unittest.TestCase):
                 self.put.return_value.status_code = 200
                 self.post.return_value.status_code = 200
                 self.delete.return_value.status_code = 200
-        class SwellMock:
-            def __init__(self):
-                self._session = SessionMock()
-                self._base_url = 'https://store_id:api_key'
-                self.logger = MagicMock()
-
         global base_model, name, endpoint, required_fields, swell
 
         name = 'tester'
         endpoint = 'mock'
         required_fields = ['name', 'value']
-        swell = SwellMock()
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        swell._session = SessionMock()
+        swell._base_url = 'https://store_id:api_key'
         base_model = Base(swell, name, endpoint=endpoint, required_fields=required_fields)
         
 
@@ -61,6 +59,104 @@ class TestBaseClass(unittest.TestCase):
         base_model._swell._session.get.assert_called_once_with(url='https://store_id:api_key/mock', params=params)
 
 
+    def test_iterate_across_pages(self):
+        """Tests iterate yields items from every page, fetching lazily"""
+
+        pages = [
+            {'count': 5, 'results': [{'id': '1'}, {'id': '2'}]},
+            {'count': 5, 'results': [{'id': '3'}, {'id': '4'}]},
+            {'count': 5, 'results': [{'id': '5'}]},
+        ]
+        responses = [MagicMock(status_code=200) for page in pages]
+        for response, page in zip(responses, pages):
+            response.json.return_value = page
+        base_model._swell._session.get.side_effect = responses
+
+        items = base_model.iterate({'sort': 'asc'}, page_size=2)
+
+        assert next(items) == {'id': '1'}
+        assert base_model._swell._session.get.call_count == 1
+        assert [item['id'] for item in items] == ['2', '3', '4', '5']
+        assert base_model._swell._session.get.call_count == 3
+        base_model._swell._session.get.assert_called_with(
+            url='https://store_id:api_key/mock', params={'sort': 'asc', 'limit': 2, 'page': 3})
+
+
+    def test_iterate_stops_on_exact_count(self):
+        """Tests iterate does not request a page past the count"""
+
+        base_model._swell._session.get.return_value.json.return_value = {'count': 2, 'results': [{'id': '1'}, {'id': '2'}]}
+
+        assert len(list(base_model.iterate(page_size=2))) == 2
+        assert base_model._swell._session.get.call_count == 1
+
+
+    def test_iterate_fails_with_invalid_page_size(self):
+        """Tests iterate validates page size"""
+
+        with self.assertRaises(ValueError):
+            next(base_model.iterate(page_size=5000))
+
+
+    def test_iterate_keyset(self):
+        """Tests keyset iteration requests items after the last one seen"""
+
+        pages = [
+            {'results': [{'id': 'a', 'date_created': '2022-01-01'}, {'id': 'b', 'date_created': '2022-01-02'}]},
+            {'results': [{'id': 'c', 'date_created': '2022-01-02'}]},
+        ]
+        responses = [MagicMock(status_code=200) for page in pages]
+        for response, page in zip(responses, pages):
+            response.json.return_value = page
+        base_model._swell._session.get.side_effect = responses
+
+        items = list(base_model.iterate({'where': {'status': 'paid'}}, page_size=2, pagination='keyset'))
+
+        assert [item['id'] for item in items] == ['a', 'b', 'c']
+        base_model._swell._session.get.assert_called_with(url='https://store_id:api_key/mock', params={
+            'limit': 2,
+            'sort': 'date_created asc, id asc',
+            'where[$and][0][status]': 'paid',
+            'where[$and][1][$or][0][date_created][$gt]': '2022-01-02',
+            'where[$and][1][$or][1][date_created]': '2022-01-02',
+            'where[$and][1][$or][1][id][$gt]': 'b',
+        })
+
+
+    def test_iterate_keyset_rejects_sort(self):
+        """Tests keyset iteration fails with a custom sort"""
+
+        with self.assertRaises(ValueError):
+            next(base_model.iterate({'sort': 'name asc'}, pagination='keyset'))
+
+
+    def test_model_default_pagination(self):
+        """Tests models can default to keyset pagination"""
+
+        assert base_model.pagination == 'page'
+        assert swell.orders.pagination == 'keyset'
+        assert swell.events.pagination == 'keyset'
+        assert swell.stock.pagination == 'keyset'
+
+
+    def test_list_all_fetches_pages_concurrently(self):
+        """Tests list_all yields every page in order"""
+
+        def get_page(url, params):
+            start = (params['page'] - 1) * params['limit']
+            response = MagicMock(status_code=200)
+            response.json.return_value = {
+                'count': 7, 'results': [{'id': str(i)} for i in range(start, min(start + params['limit'], 7))]}
+            return response
+
+        base_model._swell._session.get.side_effect = get_page
+
+        items = list(base_model.list_all(page_size=2, concurrency=3))
+
+        assert [item['id'] for item in items] == [str(i) for i in range(7)]
+        assert base_model._swell._session.get.call_count == 4
+
+
     def test_get_method_mock(self):
         """Tests get method called with correct arguments"""
 
@@ -70,6 +166,93 @@ class TestBaseClass(unittest.TestCase):
         base_model._swell._session.get.assert_called_once_with(url=f'https://store_id:api_key/mock/{id}', params=params)
 
 
+    def test_get_many(self):
+        """Tests get_many queries ids with one list request and reports missing ids"""
+
+        base_model._swell._session.get.return_value.json.return_value = {'results': [{'id': 'a'}, {'id': 'c'}]}
+
+        items = base_model.get_many(['a', 'b', 'c', 'a'], {'expand': ['variants']})
+
+        assert items == {'a': {'id': 'a'}, 'b': None, 'c': {'id': 'c'}}
+        base_model._swell._session.get.assert_called_once_with(url='https://store_id:api_key/mock', params={
+            'expand': ['variants'],
+            'where[id][$in][0]': 'a',
+            'where[id][$in][1]': 'b',
+            'where[id][$in][2]': 'c',
+            'limit': 3,
+        })
+
+
+    def test_get_many_chunks_ids(self):
+        """Tests get_many splits ids by page size and URL length"""
+
+        base_model._swell._session.get.return_value.json.return_value = {'results': []}
+
+        base_model.get_many([f'{i:024d}' for i in range(2500)])
+        short_ids = base_model._swell._session.get.call_count
+        base_model._swell._session.get.reset_mock()
+        base_model.get_many([f'{i:0200d}' for i in range(100)])
+
+        assert short_ids > 2500 // 1000
+        for call in base_model._swell._session.get.call_args_list:
+            assert len(call[1]['params']) - 1 <= 4096 // 200
+        assert base_model._swell._session.get.call_count > 100 // 20
+
+
+    def test_get_many_fails_with_invalid_ids(self):
+        """Tests get_many validates ids"""
+
+        with self.assertRaises(TypeError):
+            base_model.get_many(['abc', 123])
+
+
+    def test_get_fields(self):
+        """Tests fields are sent as a sorted selection always including id"""
+
+        base_model.get('abc123', {'expand': ['variants']}, fields=['sku', 'price', 'sku', 'variants.price'])
+
+        base_model._swell._session.get.assert_called_once_with(url='https://store_id:api_key/mock/abc123', params={
+            'expand': ['variants'], 'fields': 'id,price,sku,variants.price'})
+
+
+    def test_fields_are_validated(self):
+        """Tests invalid field selections are rejected before any request"""
+
+        with self.assertRaises(ValueError):
+            base_model.list(fields=['sku', 'price; drop'])
+        with self.assertRaises(ValueError):
+            base_model.get('abc123', {'fields': 'name'}, fields=['sku'])
+        with self.assertRaises(TypeError):
+            base_model.list(fields='sku,price')
+
+        base_model._swell._session.get.assert_not_called()
+
+
+    def test_fields_share_cache_entries(self):
+        """Tests equal field selections share a cache entry and differ from full reads"""
+
+        cached = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'cache': {'ttl': 60}}})
+        cached._session = swell._session
+        model = Base(cached, name, endpoint=endpoint)
+        cached._session.get.return_value.json.return_value = {'id': 'abc123', 'sku': 'SKU'}
+
+        model.get('abc123', fields=['sku', 'price'])
+        model.get('abc123', fields=['price', 'sku', 'id'])
+        model.get('abc123')
+
+        assert cached._session.get.call_count == 2
+
+
+    def test_iterate_keyset_fields(self):
+        """Tests keyset iteration always selects the keyset fields"""
+
+        base_model._swell._session.get.return_value.json.return_value = {'results': []}
+
+        list(base_model.iterate(pagination='keyset', fields=['sku']))
+
+        assert base_model._swell._session.get.call_args[1]['params']['fields'] == 'date_created,id,sku'
+
+
     def test_get_fails_with_no_id(self):
         """Tests get method failure with no id"""
 
@@ -90,7 +273,26 @@ class TestBaseClass(unittest.TestCase):
         id = 'abc123'
         params = {'id': id, 'name': 'test'}
         base_model.update(params)
-        base_model._swell._session.put.assert_called_once_with(url=f'https://store_id:api_key/mock/{id}', json=params)
+        base_model._swell._session.put.assert_called_once_with(url=f'https://store_id:api_key/mock/{id}', data=codec.dumps(params), headers={'Content-Type': 'application/json'})
+
+
+    def test_update_delta_sends_changed_fields(self):
+        """Tests delta updates only send fields that differ from the base"""
+
+        base = {'id': 'abc123', 'name': 'test', 'price': 10, 'variants': {'results': [{'id': 'v1'}]}}
+        base_model.update({'id': 'abc123', 'name': 'test', 'price': 12, 'variants': base['variants']}, base)
+
+        base_model._swell._session.put.assert_called_once_with(
+            url='https://store_id:api_key/mock/abc123', data=codec.dumps({'id': 'abc123', 'price': 12}), headers={'Content-Type': 'application/json'})
+
+
+    def test_update_delta_skips_unchanged(self):
+        """Tests no request is sent when nothing changed"""
+
+        base = {'id': 'abc123', 'name': 'test', 'price': 10}
+
+        assert base_model.update({'id': 'abc123', 'price': 10}, base) == base
+        base_model._swell._session.put.assert_not_called()
 
 
     def test_update_fails_with_no_id(self):
@@ -115,6 +317,51 @@ class TestBaseClass(unittest.TestCase):
         base_model._swell._session.delete.assert_called_once_with(url=f'https://store_id:api_key/mock/{id}')
 
 
+    def test_create_many_reports_partial_failures(self):
+        """Tests create_many returns a result per item without stopping on errors"""
+
+        def post(url, data, headers):
+            payload = codec.loads(data)
+            response = MagicMock(status_code=500 if payload['name'] == 'bad' else 200, reason='Error')
+            response.json.return_value = {'id': payload['name']}
+            return response
+
+        base_model._swell._session.post.side_effect = post
+        base_model._swell.retry.max_attempts = 1
+
+        results = base_model.create_many([{'name': 'a', 'value': 1}, {'name': 'bad', 'value': 2}, {'name': 'c', 'value': 3}])
+
+        assert [result['index'] for result in results] == [0, 1, 2]
+        assert [result['ok'] for result in results] == [True, False, True]
+        assert results[0]['result'] == {'id': 'a'}
+        assert isinstance(results[1]['error'], HTTPError)
+        assert base_model._swell._session.post.call_count == 3
+
+
+    def test_create_many_validates_up_front(self):
+        """Tests no request is sent when any payload is invalid"""
+
+        with self.assertRaises(ValueError) as error:
+            base_model.create_many([{'name': 'a', 'value': 1}, {'name': 'b'}, {}])
+
+        assert '1:' in str(error.exception) and '2:' in str(error.exception)
+        base_model._swell._session.post.assert_not_called()
+
+
+    def test_update_and_delete_many(self):
+        """Tests update_many and delete_many send one request per item"""
+
+        updates = base_model.update_many([{'id': 'a', 'name': 'x'}, {'id': 'b', 'name': 'y'}], concurrency=2)
+        deletes = base_model.delete_many(['a', 'b', 'c'])
+
+        assert all(result['ok'] for result in updates + deletes)
+        assert base_model._swell._session.put.call_count == 2
+        assert base_model._swell._session.delete.call_count == 3
+
+        with self.assertRaises(ValueError):
+            base_model.delete_many(['a', 123])
+
+
     def test_delete_fails_with_no_id(self):
         """ Tests delete method failure with missing id"""
 
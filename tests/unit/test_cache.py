@@ -0,0 +1,258 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, AsyncMock, patch
+from swellpy import Swell, AsyncSwell, codec
+from swellpy.cache import MemoryCache, SQLiteCache, create_cache
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def test_set_and_get(self):
+        """Tests cached values are returned as copies"""
+
+        cache = MemoryCache()
+        cache.set('key', {'id': 'abc'}, ttl=60)
+        value = cache.get('key')
+        value['id'] = 'changed'
+
+        assert cache.get('key') == {'id': 'abc'}
+        assert cache.get('missing') is None
+
+    def test_expiry(self):
+        """Tests entries expire after their ttl"""
+
+        cache = MemoryCache()
+
+        with patch('swellpy.cache.time.monotonic', return_value=100):
+            cache.set('key', {'id': 'abc'}, ttl=10)
+        with patch('swellpy.cache.time.monotonic', return_value=105):
+            assert cache.get('key') is not None
+        with patch('swellpy.cache.time.monotonic', return_value=111):
+            assert cache.get('key') is None
+
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        """Tests the least recently used entry is evicted"""
+
+        cache = MemoryCache(max_entries=2)
+        cache.set('a', {'id': 'a'}, ttl=60)
+        cache.set('b', {'id': 'b'}, ttl=60)
+        cache.get('a')
+        cache.set('c', {'id': 'c'}, ttl=60)
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+
+    def test_eviction_by_bytes(self):
+        """Tests entries are evicted to stay under max bytes"""
+
+        cache = MemoryCache(max_bytes=40)
+        cache.set('a', {'name': 'x' * 20}, ttl=60)
+        cache.set('b', {'name': 'y' * 20}, ttl=60)
+
+        assert cache.get('a') is None
+        assert cache.get('b') is not None
+
+    def test_invalidate_tag(self):
+        """Tests invalidating a tag removes every tagged entry"""
+
+        cache = MemoryCache()
+        cache.set('a', {'id': 'a'}, ttl=60, tags=['products:a'])
+        cache.set('slug', {'id': 'a'}, ttl=60, tags=['products:slug', 'products:a'])
+        cache.set('b', {'id': 'b'}, ttl=60, tags=['products:b'])
+        cache.invalidate('products:a')
+
+        assert cache.get('a') is None
+        assert cache.get('slug') is None
+        assert cache.get('b') is not None
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'cache.db')
+
+    def test_shared_between_instances(self):
+        """Tests entries written by one process are read by another"""
+
+        SQLiteCache(self.path).set('key', {'id': 'abc'}, ttl=60, tags=['products:abc'])
+
+        assert SQLiteCache(self.path).get('key') == {'id': 'abc'}
+        assert SQLiteCache(self.path).get('missing') is None
+
+    def test_expiry(self):
+        """Tests expired entries are not returned and are swept"""
+
+        cache = SQLiteCache(self.path)
+
+        with patch('swellpy.cache.time.time', return_value=100):
+            cache.set('key', {'id': 'abc'}, ttl=10)
+        with patch('swellpy.cache.time.time', return_value=111):
+            assert cache.get('key') is None
+            cache.sweep()
+
+        assert len(cache) == 0
+
+    def test_invalidate_tag(self):
+        """Tests invalidating a tag removes every tagged entry"""
+
+        cache = SQLiteCache(self.path)
+        cache.set('a', {'id': 'a'}, ttl=60, tags=['products:a'])
+        cache.set('b', {'id': 'b'}, ttl=60, tags=['products:b'])
+        cache.invalidate('products:a')
+
+        assert cache.get('a') is None
+        assert cache.get('b') == {'id': 'b'}
+
+    def test_sweep_enforces_caps(self):
+        """Tests sweeps evict least recently used entries over the caps"""
+
+        cache = SQLiteCache(self.path, max_entries=2)
+        for index, key in enumerate(['a', 'b', 'c']):
+            with patch('swellpy.cache.time.time', return_value=100 + index):
+                cache.set(key, {'id': key}, ttl=1e10)
+        with patch('swellpy.cache.time.time', return_value=110):
+            cache.get('a')
+            cache.sweep()
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert len(cache) == 2
+
+        cache.max_bytes = 15
+        cache.sweep()
+
+        assert len(cache) == 1
+
+    def test_reads_seldom_write(self):
+        """Tests a hit only updates the access time once it is older than a tenth of the sweep interval"""
+
+        cache = SQLiteCache(self.path, sweep_interval=60)
+        with patch('swellpy.cache.time.time', return_value=100):
+            cache.set('key', {'id': 'abc'}, ttl=1e10)
+
+        for now, accessed in ((103, 100), (105.9, 100), (106, 106), (110, 106)):
+            with patch('swellpy.cache.time.time', return_value=now):
+                assert cache.get('key') == {'id': 'abc'}
+            assert cache._connection().execute('SELECT accessed FROM entries').fetchone()[0] == accessed
+
+    def test_create_cache(self):
+        """Tests cache backends are created from options"""
+
+        custom = MemoryCache()
+
+        assert isinstance(create_cache({}), MemoryCache)
+        assert isinstance(create_cache({'backend': 'sqlite', 'path': self.path}), SQLiteCache)
+        assert create_cache({'backend': custom}) is custom
+        with self.assertRaises(ValueError):
+            create_cache({'backend': 'sqlite'})
+        with self.assertRaises(ValueError):
+            create_cache({'backend': 'redis'})
+
+
+class TestModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'rate_limit_calls': 100, 'cache': {'models': {'products': 60}}}})
+        self.swell._session = MagicMock()
+        self.swell._session.get.return_value.status_code = 200
+        self.swell._session.get.return_value.json.return_value = {'id': 'abc', 'name': 'Product'}
+        self.swell._session.put.return_value.status_code = 200
+        self.swell._session.put.return_value.json.return_value = {'id': 'abc', 'name': 'Updated'}
+
+    def test_get_is_cached(self):
+        """Tests repeated gets are served from the cache"""
+
+        assert self.swell.products.get('abc') == {'id': 'abc', 'name': 'Product'}
+        assert self.swell.products.get('abc') == {'id': 'abc', 'name': 'Product'}
+        assert self.swell._session.get.call_count == 1
+
+    def test_list_is_cached_by_normalized_params(self):
+        """Tests lists with equivalent params share a cache entry"""
+
+        self.swell.products.list({'limit': 10, 'page': 1})
+        self.swell.products.list({'page': 1, 'limit': 10})
+        self.swell.products.list({'page': 2, 'limit': 10})
+
+        assert self.swell._session.get.call_count == 2
+
+    def test_uncached_models(self):
+        """Tests models without a ttl are not cached"""
+
+        self.swell.orders.get('abc')
+        self.swell.orders.get('abc')
+
+        assert self.swell._session.get.call_count == 2
+
+    def test_update_invalidates(self):
+        """Tests updating a record invalidates its cached responses and lists"""
+
+        self.swell.products.get('abc')
+        self.swell.products.list()
+        self.swell.products.update({'id': 'abc', 'name': 'Updated'})
+        self.swell.products.get('abc')
+        self.swell.products.list()
+
+        assert self.swell._session.get.call_count == 4
+
+    def test_delete_invalidates(self):
+        """Tests deleting a record invalidates its cached responses"""
+
+        self.swell._session.delete.return_value.status_code = 200
+        self.swell.products.get('abc')
+        self.swell.products.delete('abc')
+        self.swell.products.get('abc')
+
+        assert self.swell._session.get.call_count == 2
+
+    def test_get_many_uses_cache(self):
+        """Tests get_many skips cached ids and caches fetched records"""
+
+        self.swell.products.get('abc')
+        self.swell._session.get.return_value.json.return_value = {'results': [{'id': 'def'}]}
+
+        assert self.swell.products.get_many(['abc', 'def']) == {'abc': {'id': 'abc', 'name': 'Product'}, 'def': {'id': 'def'}}
+        assert self.swell._session.get.call_args[1]['params']['where[id][$in][0]'] == 'def'
+        assert self.swell.products.get('def') == {'id': 'def'}
+        assert self.swell._session.get.call_count == 2
+        # Each record is stored once, under its get key, and the batch itself is not cached
+        assert len(self.swell.cache) == 2
+
+    def test_delta_update_uses_cached_snapshot(self):
+        """Tests delta updates diff against the cached record"""
+
+        self.swell.products.get('abc')
+
+        assert self.swell.products.update({'id': 'abc', 'name': 'Product'}, delta=True) == {'id': 'abc', 'name': 'Product'}
+        self.swell._session.put.assert_not_called()
+
+        results = self.swell.products.update_many([{'id': 'abc', 'name': 'Renamed'}], delta=True)
+
+        assert results[0]['ok']
+        self.swell._session.put.assert_called_once_with(
+            url=f'{self.swell._base_url}/products/abc', data=codec.dumps({'id': 'abc', 'name': 'Renamed'}),
+            headers={'Content-Type': 'application/json'})
+
+    def test_async_client_cache(self):
+        """Tests cached reads resolve as coroutines on an async client"""
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'rate_limit_calls': 100, 'cache': {'ttl': 60}}})
+        swell._session = MagicMock()
+        swell._session.get = AsyncMock(return_value=MagicMock(status_code=200))
+        swell._session.get.return_value.json.return_value = {'id': 'abc'}
+
+        async def get_twice():
+            return [await swell.categories.get('abc'), await swell.categories.get('abc')]
+
+        assert asyncio.run(get_twice()) == [{'id': 'abc'}, {'id': 'abc'}]
+        assert swell._session.get.call_count == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
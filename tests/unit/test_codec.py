@@ -0,0 +1,72 @@
+import importlib
+import unittest
+from datetime import datetime, date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from swellpy import codec
+from swellpy.utilities import decode_response
+
+
+class TestCodec(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Tests values are encoded to bytes and decoded back"""
+
+        value = {'name': 'Prödüct', 'price': 10.5, 'tags': ['a', None, True]}
+
+        assert isinstance(codec.dumps(value), bytes)
+        assert codec.loads(codec.dumps(value)) == value
+        assert codec.loads(codec.dumps(value).decode()) == value
+
+    def test_decimals_and_dates(self):
+        """Tests decimals are encoded as numbers and dates as ISO strings"""
+
+        value = {'price': Decimal('19.99'), 'date': date(2022, 1, 2), 'datetime': datetime(2022, 1, 2, 3, 4, 5)}
+
+        assert codec.loads(codec.dumps(value)) == {
+            'price': 19.99, 'date': '2022-01-02', 'datetime': '2022-01-02T03:04:05'}
+
+    def test_non_string_keys_and_large_integers(self):
+        """Tests payloads the standard library encodes are encoded the same by every backend"""
+
+        value = {1: 'one', 'big': 2 ** 70, 'small': -2 ** 70}
+
+        assert codec.loads(codec.dumps(value)) == {'1': 'one', 'big': 2 ** 70, 'small': -2 ** 70}
+
+    def test_unsupported_values_raise_type_error(self):
+        """Tests values no backend can encode still raise TypeError"""
+
+        with self.assertRaises(TypeError):
+            codec.dumps({'value': object()})
+
+    def test_invalid_json_raises_value_error(self):
+        """Tests decoding errors are ValueErrors with every backend"""
+
+        with self.assertRaises(ValueError):
+            codec.loads(b'{not json')
+
+    def test_stdlib_fallback(self):
+        """Tests the standard library is used when no fast backend is installed"""
+
+        backend = codec.backend
+        try:
+            with patch.dict('sys.modules', {'orjson': None, 'ujson': None}):
+                fallback = importlib.reload(codec)
+            assert fallback.backend == 'json'
+            assert fallback.loads(fallback.dumps({'price': Decimal('1.5'), 'date': date(2022, 1, 2)})) == {
+                'price': 1.5, 'date': '2022-01-02'}
+        finally:
+            # Reloaded once the fast backends are importable again
+            assert importlib.reload(codec).backend == backend
+
+    def test_decode_response(self):
+        """Tests raw response bodies are decoded with the codec"""
+
+        response = MagicMock(content=b'{"id": "abc"}')
+
+        assert decode_response(response) == {'id': 'abc'}
+        response.json.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
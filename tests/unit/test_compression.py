@@ -0,0 +1,105 @@
+import asyncio
+import gzip
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from swellpy import Swell, AsyncSwell, codec
+from swellpy.compression import accept_encoding, compress_body
+
+
+PRODUCT = {'name': 'Product', 'variants': [{'name': f'Variant {i}', 'price': 10} for i in range(500)]}
+
+
+class TestCompression(unittest.TestCase):
+
+    def swell(self, options: dict) -> Swell:
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100, **options}})
+        swell._session = MagicMock()
+        swell._session.post.return_value.status_code = 200
+        swell._base_url = 'https://store_id:api_key'
+        return swell
+
+    def test_accept_encoding(self):
+        """Tests brotli is only requested when it can be decoded"""
+
+        with patch('swellpy.compression._brotli_available', return_value=False):
+            assert accept_encoding() == 'gzip, deflate'
+        with patch('swellpy.compression._brotli_available', return_value=True):
+            assert accept_encoding() == 'gzip, deflate, br'
+
+    def test_session_negotiates_compression(self):
+        """Tests the session sends an explicit Accept-Encoding header"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+
+        assert swell._session.headers['Accept-Encoding'] == accept_encoding()
+
+    def test_compress_body(self):
+        """Tests only bodies above the threshold are compressed"""
+
+        headers = {}
+        assert compress_body(b'{}', headers, 10) == b'{}'
+        assert headers == {}
+
+        body = codec.dumps(PRODUCT)
+        compressed = compress_body(body, headers, 10)
+        assert gzip.decompress(compressed) == body
+        assert len(compressed) < len(body)
+        assert headers == {'Content-Encoding': 'gzip'}
+
+    def test_large_payloads_are_compressed(self):
+        """Tests large request bodies are gzipped when enabled"""
+
+        swell = self.swell({'compress_requests': True})
+
+        swell.products.create(PRODUCT)
+
+        kwargs = swell._session.post.call_args[1]
+        assert kwargs['headers'] == {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+        assert json.loads(gzip.decompress(kwargs['data'])) == PRODUCT
+
+    def test_small_payloads_are_not_compressed(self):
+        """Tests bodies below the threshold are sent as is"""
+
+        swell = self.swell({'compress_requests': True, 'compress_threshold': 1024})
+
+        swell.products.create({'name': 'Product'})
+
+        swell._session.post.assert_called_once_with(
+            url='https://store_id:api_key/products/', data=codec.dumps({'name': 'Product'}),
+            headers={'Content-Type': 'application/json'})
+
+    def test_compression_disabled_by_default(self):
+        """Tests request bodies are not compressed without the option"""
+
+        swell = self.swell({})
+
+        swell.products.create(PRODUCT)
+
+        assert swell._session.post.call_args[1]['data'] == codec.dumps(PRODUCT)
+
+    def test_async_compression(self):
+        """Tests AsyncSwell compresses request bodies and decodes compressed responses"""
+
+        import httpx
+
+        def handler(request):
+            assert request.headers['Content-Encoding'] == 'gzip'
+            assert json.loads(gzip.decompress(request.content)) == PRODUCT
+            return httpx.Response(
+                200, content=gzip.compress(json.dumps({'id': 'abc', **PRODUCT}).encode()),
+                headers={'Content-Encoding': 'gzip'})
+
+        async def run():
+            swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+                'rate_limit_calls': 100, 'compress_requests': True, 'compress_threshold': 100}})
+            swell._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            swell._base_url = 'https://api.swell.store'
+            async with swell:
+                return await swell.products.create(PRODUCT)
+
+        assert asyncio.run(run())['id'] == 'abc'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from requests.exceptions import HTTPError
+from swellpy import Swell, AsyncSwell
+
+
+def response(status_code, body=b'{}'):
+    return MagicMock(status_code=status_code, headers={}, reason='Reason', content=body)
+
+
+class TestHooks(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+        self.swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'rate_limit_calls': 100, 'hooks': [self.events.append]}})
+        self.swell._session = MagicMock()
+        self.swell._base_url = 'https://store_id:api_key'
+
+    def test_request_event(self):
+        """Tests a structured event is emitted for each request"""
+
+        self.swell._session.get.return_value = response(200, b'{"id": "abc"}')
+
+        assert self.swell.products.get('abc') == {'id': 'abc'}
+
+        [event] = self.events
+        assert {key: event[key] for key in ('store_id', 'model', 'endpoint', 'method', 'url', 'status', 'bytes', 'retries', 'error')} == {
+            'store_id': 'store_id', 'model': 'products', 'endpoint': 'products', 'method': 'GET',
+            'url': 'https://store_id:api_key/products/abc', 'status': 200, 'bytes': 13, 'retries': 0, 'error': None}
+        assert event['limiter_wait'] >= 0
+        assert 0 <= event['latency'] <= event['duration']
+        assert 0 <= event['decode_time'] <= event['duration']
+
+    @patch('time.sleep')
+    def test_retries_are_counted(self, sleep):
+        """Tests retried requests emit one event counting the retries"""
+
+        self.swell._session.get.side_effect = [response(503), response(200)]
+
+        self.swell.products.list()
+
+        assert len(self.events) == 1
+        assert self.events[0]['retries'] == 1
+        assert self.events[0]['status'] == 200
+
+    def test_failed_request_event(self):
+        """Tests failed requests emit an event with the error"""
+
+        self.swell._session.delete.return_value = response(404)
+
+        with self.assertRaises(HTTPError):
+            self.swell.products.delete('abc')
+
+        assert self.events[0]['status'] == 404
+        assert isinstance(self.events[0]['error'], HTTPError)
+
+    def test_stream_event(self):
+        """Tests streamed lists emit an event once consumed"""
+
+        body = json.dumps({'count': 2, 'results': [{'id': 'a'}, {'id': 'b'}]}).encode()
+        streamed = response(200)
+        streamed.iter_content.return_value = [body[:10], body[10:]]
+        self.swell._session.get.return_value = streamed
+
+        assert len(list(self.swell.products.stream())) == 2
+
+        [event] = self.events
+        assert event['bytes'] == len(body)
+        assert event['decode_time'] is None
+        assert event['error'] is None
+
+    def test_add_and_remove_hooks(self):
+        """Tests hooks can be added, used as decorators and removed"""
+
+        self.swell._session.get.return_value = response(200)
+        calls = []
+
+        @self.swell.add_hook
+        def hook(event):
+            calls.append(event['model'])
+
+        self.swell.orders.list()
+        self.swell.remove_hook(hook)
+        self.swell.orders.list()
+
+        assert calls == ['orders']
+        assert len(self.events) == 2
+
+    def test_failing_hook_is_ignored(self):
+        """Tests a hook raising does not fail the request"""
+
+        self.swell._session.get.return_value = response(200, b'{"id": "abc"}')
+        self.swell.add_hook(MagicMock(side_effect=ValueError('hook failed')))
+
+        with self.assertLogs('swellpy.swell', 'WARNING'):
+            assert self.swell.products.get('abc') == {'id': 'abc'}
+
+    def test_no_events_without_hooks(self):
+        """Tests no event is built when no hook is registered"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+
+        assert swell._start_event(swell.products, 'get', 'url') is None
+
+    def test_async_request_event(self):
+        """Tests AsyncSwell emits the same events"""
+
+        import httpx
+
+        events = []
+
+        async def run():
+            swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+                'rate_limit_calls': 100, 'hooks': [events.append]}})
+            swell._session = httpx.AsyncClient(transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={'results': [{'id': 'a'}]})))
+            swell._base_url = 'https://api.swell.store'
+            async with swell:
+                await swell.orders.list()
+                return [item async for item in swell.orders.astream()]
+
+        assert asyncio.run(run()) == [{'id': 'a'}]
+        assert [(event['model'], event['status'], event['error']) for event in events] == [
+            ('orders', 200, None), ('orders', 200, None)]
+        assert events[0]['bytes'] == events[1]['bytes'] > 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock
+from swellpy import Swell, AsyncSwell
+from swellpy.invalidation import CacheInvalidator
+
+
+def response(json_data):
+    res = MagicMock(status_code=200)
+    res.json.return_value = json_data
+    return res
+
+
+class TestCacheInvalidator(unittest.TestCase):
+
+    def setUp(self):
+        self.swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'rate_limit_calls': 100, 'cache': {'ttl': 3600}}})
+        self.swell._session = MagicMock()
+        self.swell._session.get.return_value = response({'id': 'abc', 'name': 'Product'})
+
+    def test_webhook_invalidates_record(self):
+        """Tests a webhook payload drops the cached record"""
+
+        invalidator = CacheInvalidator(self.swell)
+        self.swell.products.get('abc')
+        self.swell.products.get('other')
+
+        invalidator.handle_event({'type': 'product.updated', 'data': {'id': 'abc'}})
+        self.swell.products.get('abc')
+
+        assert self.swell._session.get.call_count == 3
+
+    def test_event_model_names(self):
+        """Tests the model is read from the event or derived from its type"""
+
+        invalidator = CacheInvalidator(self.swell)
+
+        assert invalidator._model({'model': 'categories', 'type': 'category.updated'}) is self.swell.categories
+        assert invalidator._model({'type': 'category.updated'}) is self.swell.categories
+        assert invalidator._model({'type': 'order.created'}) is self.swell.orders
+        assert invalidator._model({'type': 'unknown.updated'}) is None
+        assert invalidator.handle_event({'type': 'unknown.updated', 'data': {'id': 'abc'}}) is None
+
+    def test_refresh_updated_record(self):
+        """Tests refresh refetches updated records but not deleted ones"""
+
+        invalidator = CacheInvalidator(self.swell, refresh=True)
+
+        assert invalidator.handle_event({'type': 'product.updated', 'data': {'id': 'abc'}}) == {'id': 'abc', 'name': 'Product'}
+        assert invalidator.handle_event({'type': 'product.deleted', 'data': {'id': 'abc'}}) is None
+        assert self.swell._session.get.call_count == 1
+
+    def test_poll_events(self):
+        """Tests polling handles new events and resumes after the last one"""
+
+        invalidator = CacheInvalidator(self.swell, since='2022-01-01T00:00:00.000Z')
+        self.swell.products.get('abc')
+        self.swell._session.get.return_value = response({'results': [
+            {'id': 'e1', 'date_created': '2022-01-02T00:00:00.000Z', 'type': 'product.updated', 'data': {'id': 'abc'}},
+        ]})
+
+        assert invalidator.poll() == 1
+        self.swell._session.get.assert_called_with(url=f'{self.swell._base_url}/events', params={
+            'limit': 100,
+            'sort': 'date_created asc, id asc',
+            'where[$or][0][date_created][$gt]': '2022-01-01T00:00:00.000Z',
+            'where[$or][1][date_created]': '2022-01-01T00:00:00.000Z',
+            'where[$or][1][id][$gt]': '',
+        })
+        assert invalidator._last['id'] == 'e1'
+
+        self.swell._session.get.return_value = response({'id': 'abc'})
+        self.swell.products.get('abc')
+        assert self.swell._session.get.call_count == 3
+
+    def test_events_are_not_cached(self):
+        """Tests polled events are never served from the cache"""
+
+        self.swell.events.list()
+        self.swell.events.list()
+
+        assert self.swell._session.get.call_count == 2
+
+    def test_apoll_events(self):
+        """Tests async polling refreshes records"""
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'rate_limit_calls': 100, 'cache': {'ttl': 3600}}})
+        swell._session = MagicMock()
+        swell._session.get = AsyncMock(side_effect=[
+            response({'results': [{'id': 'e1', 'date_created': '2022-01-02', 'model': 'products', 'type': 'product.updated', 'data': {'id': 'abc'}}]}),
+            response({'id': 'abc'}),
+        ])
+        invalidator = CacheInvalidator(swell, refresh=True)
+
+        assert asyncio.run(invalidator.apoll()) == 1
+        assert swell._session.get.call_count == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from swellpy import Swell
+from swellpy.limiter import TokenBucket, FileTokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_is_available_immediately(self):
+        """Tests calls up to the burst capacity do not wait"""
+
+        bucket = TokenBucket(calls=5, period=1)
+
+        assert [bucket.reserve() for i in range(5)] == [0.0] * 5
+
+    def test_waits_once_bucket_is_empty(self):
+        """Tests calls beyond the burst wait for the refill rate"""
+
+        bucket = TokenBucket(calls=2, period=1)
+        bucket.reserve()
+        bucket.reserve()
+
+        self.assertAlmostEqual(bucket.reserve(), 0.5, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 1.0, places=2)
+
+    def test_wait_time(self):
+        """Tests current wait time is exposed without taking a token"""
+
+        bucket = TokenBucket(calls=1, period=2)
+
+        assert bucket.wait_time == 0.0
+        bucket.reserve()
+        self.assertAlmostEqual(bucket.wait_time, 2.0, places=2)
+        self.assertAlmostEqual(bucket.wait_time, 2.0, places=2)
+
+    def test_custom_burst(self):
+        """Tests burst capacity can differ from the rate"""
+
+        bucket = TokenBucket(calls=1, period=1, burst=3)
+
+        assert [bucket.reserve() for i in range(3)] == [0.0] * 3
+        assert bucket.reserve() > 0
+
+    def test_invalid_rate(self):
+        """Tests non-positive rates are rejected"""
+
+        with self.assertRaises(ValueError):
+            TokenBucket(calls=0, period=1)
+
+    def test_acquire_sleeps_for_wait(self):
+        """Tests acquire blocks for the reserved wait"""
+
+        bucket = TokenBucket(calls=1, period=1)
+        bucket.acquire()
+
+        with patch('swellpy.limiter.time.sleep') as sleep:
+            bucket.acquire()
+
+        self.assertAlmostEqual(sleep.call_args[0][0], 1.0, places=2)
+
+    def test_acquire_async(self):
+        """Tests async acquire waits on the event loop"""
+
+        bucket = TokenBucket(calls=100, period=1)
+
+        assert asyncio.run(bucket.acquire_async()) == 0.0
+
+
+class TestFileTokenBucket(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'swell.limit')
+
+    def test_buckets_on_same_file_share_budget(self):
+        """Tests separately opened buckets draw from one budget"""
+
+        first = FileTokenBucket(self.path, calls=2, period=1)
+        second = FileTokenBucket(self.path, calls=2, period=1)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        self.assertAlmostEqual(first.reserve(), 0.5, places=2)
+        self.assertAlmostEqual(second.wait_time, 1.0, places=2)
+
+    def test_budget_shared_across_processes(self):
+        """Tests a forked process sees tokens taken by its parent"""
+
+        bucket = FileTokenBucket(self.path, calls=1, period=10)
+        bucket.reserve()
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if bucket.reserve() > 0 else 1)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        self.assertAlmostEqual(bucket.wait_time, 20.0, places=1)
+
+    def test_stale_file(self):
+        """Tests a state file written with a later clock (ie before a reboot) does not stall callers"""
+
+        with open(self.path, 'wb') as file:
+            file.write(FileTokenBucket._format.pack(-5, time.time() + 86400))
+
+        bucket = FileTokenBucket(self.path, calls=10, period=1)
+
+        self.assertAlmostEqual(bucket.reserve(), 0.6, places=2)
+        self.assertAlmostEqual(bucket.wait_time, 0.7, places=2)
+
+    def test_state_uses_wall_clock(self):
+        """Tests the shared file stores wall clock time, which survives reboots"""
+
+        bucket = FileTokenBucket(self.path, calls=10, period=1)
+        bucket.reserve()
+
+        with open(self.path, 'rb') as file:
+            tokens, updated = FileTokenBucket._format.unpack(file.read())
+
+        self.assertAlmostEqual(updated, time.time(), delta=5)
+        self.assertAlmostEqual(tokens, 9, places=2)
+
+
+class TestSharedLimiter(unittest.TestCase):
+
+    def test_models_share_client_limiter(self):
+        """Tests all models draw from one limiter owned by the client"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'rate_limit_calls': 4, 'rate_limit_period': 2, 'rate_limit_burst': 8}})
+
+        assert swell.limiter.rate == 2
+        assert swell.limiter.burst == 8
+        assert swell.products._swell.limiter is swell.orders._swell.limiter
+
+    def test_limiter_options(self):
+        """Tests a file-backed or custom limiter can be configured"""
+
+        path = os.path.join(tempfile.mkdtemp(), 'swell.limit')
+        file_swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_file': path}})
+        limiter = TokenBucket(calls=10, period=1)
+        custom_swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limiter': limiter}})
+
+        assert isinstance(file_swell.limiter, FileTokenBucket)
+        assert file_swell.limiter.path == path
+        assert custom_swell.limiter is limiter
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import gc
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, AsyncMock
+from swellpy import Swell, AsyncSwell
+from swellpy.loader import BatchLoader, AsyncBatchLoader
+
+
+def response(json_data):
+    res = MagicMock(status_code=200)
+    res.json.return_value = json_data
+    return res
+
+
+class TestBatchLoader(unittest.TestCase):
+
+    def test_loads_are_batched(self):
+        """Tests ids loaded by several threads within the window share one request"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        swell._session = MagicMock()
+        swell._session.get.return_value = response({'results': [{'id': 'a'}, {'id': 'b'}]})
+        loader = BatchLoader(swell.products, window=0.05)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            records = list(executor.map(loader.get, ['a', 'b', 'missing']))
+
+        assert records == [{'id': 'a'}, {'id': 'b'}, None]
+        assert swell._session.get.call_count == 1
+
+    def test_errors_reach_every_load(self):
+        """Tests a failed batch fails every pending load"""
+
+        model = MagicMock()
+        model.get_many.side_effect = ValueError('failed')
+        loader = BatchLoader(model)
+        futures = [loader.load('a'), loader.load('b')]
+        loader.dispatch()
+
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result()
+
+
+class TestAsyncBatchLoader(unittest.TestCase):
+
+    def test_loads_in_same_tick_are_batched(self):
+        """Tests ids loaded by tasks in the same loop iteration share one request"""
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        swell._session = MagicMock()
+        swell._session.get = AsyncMock(return_value=response({'results': [{'id': 'a'}, {'id': 'b'}]}))
+        loader = AsyncBatchLoader(swell.products)
+
+        async def run():
+            return await asyncio.gather(loader.load('a'), loader.load('b'), loader.load('a'), loader.load('c'))
+
+        assert asyncio.run(run()) == [{'id': 'a'}, {'id': 'b'}, {'id': 'a'}, None]
+        assert swell._session.get.call_count == 1
+
+    def test_dispatch_task_is_referenced(self):
+        """Tests the loader keeps its dispatch task alive until it completes"""
+
+        model = MagicMock()
+        started = None
+
+        async def get_many(ids, params):
+            nonlocal started
+            started = set(loader._dispatches)
+            gc.collect()
+            return {id: {'id': id} for id in ids}
+
+        model.get_many = get_many
+        loader = AsyncBatchLoader(model)
+
+        assert asyncio.run(loader.load('a')) == {'id': 'a'}
+        assert len(started) == 1
+        assert loader._dispatches == set()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import asyncio
+import base64
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from swellpy import Swell, AsyncSwell
+from swellpy.pool import SwellPool, AsyncSwellPool
+
+
+STORES = {'store-a': 'key-a', 'store-b': 'key-b', 'store-c': {'api_key': 'key-c', 'options': {'rate_limit_calls': 10}}}
+
+
+class TestSwellPool(unittest.TestCase):
+
+    def test_clients_share_connection_pool(self):
+        """Tests store clients share one adapter but keep their own credentials and limits"""
+
+        pool = SwellPool(STORES, {'rate_limit_calls': 4, 'max_connections': 20})
+        a, b, c = pool.get('store-a'), pool['store-b'], pool.get('store-c')
+        url = f'{a._base_url}/products'
+
+        assert isinstance(a, Swell) and a._store_id == 'store-a'
+        assert a._session.get_adapter(url) is b._session.get_adapter(url)
+        assert a._session.get_adapter(url)._pool_maxsize == 20
+        assert (a._session.auth, b._session.auth) == (('store-a', 'key-a'), ('store-b', 'key-b'))
+        assert a.limiter is not b.limiter
+        assert (a.rate_limit_calls, c.rate_limit_calls) == (4, 10)
+        assert pool.get('store-a') is a
+
+    def test_lru_eviction(self):
+        """Tests the least recently used clients are evicted beyond max_clients"""
+
+        pool = SwellPool(STORES, max_clients=2)
+        a = pool.get('store-a')
+        pool.get('store-b')
+        pool.get('store-a')
+        pool.get('store-c')
+
+        assert 'store-a' in pool and 'store-c' in pool and 'store-b' not in pool
+        assert len(pool) == 2
+        assert pool.get('store-a') is a
+
+        pool.evict('store-a')
+        assert pool.get('store-a') is not a
+
+    @patch('swellpy.pool.time.monotonic')
+    def test_idle_eviction(self, monotonic):
+        """Tests clients unused for idle_timeout are evicted"""
+
+        pool = SwellPool(STORES, idle_timeout=60)
+        monotonic.return_value = 0
+        a = pool.get('store-a')
+        monotonic.return_value = 50
+        pool.get('store-b')
+        monotonic.return_value = 100
+
+        pool.get('store-c')
+
+        assert 'store-a' not in pool and 'store-b' in pool
+        assert pool.get('store-a') is not a
+
+    def test_unknown_store(self):
+        """Tests stores without credentials are rejected"""
+
+        with self.assertRaises(KeyError):
+            SwellPool(STORES).get('store-z')
+
+    def test_credentials_loader(self):
+        """Tests credentials can be loaded by a function"""
+
+        pool = SwellPool(lambda store_id: f'{store_id}-key')
+
+        assert pool.get('store-x')._session.auth == ('store-x', 'store-x-key')
+
+    def test_per_store_limiter_file(self):
+        """Tests a store_id placeholder gives every store its own limiter file"""
+
+        pool = SwellPool(STORES, {'rate_limit_file': '/tmp/swellpy-test-{store_id}.limit'})
+
+        assert pool.get('store-a').limiter.path == '/tmp/swellpy-test-store-a.limit'
+        assert pool.get('store-b').limiter.path == '/tmp/swellpy-test-store-b.limit'
+
+    def test_evicted_limiter_files_are_closed(self):
+        """Tests evicting clients closes their limiter files instead of leaking descriptors"""
+
+        path = os.path.join(tempfile.mkdtemp(), '{store_id}.limit')
+        stores = {f'store-{i}': 'key' for i in range(10)}
+        pool = SwellPool(stores, {'rate_limit_file': path}, max_clients=2)
+        open_files = len(os.listdir('/dev/fd'))
+
+        for i in range(3):
+            for store_id in stores:
+                pool.get(store_id).limiter.reserve()
+
+        assert len(os.listdir('/dev/fd')) <= open_files + 2
+
+        limiter = pool.get('store-9').limiter
+        pool.close()
+        assert limiter._fd is None
+
+    def test_shared_cache(self):
+        """Tests stores share one cache backend, namespaced by store"""
+
+        pool = SwellPool(STORES, {'cache': {'ttl': 60, 'max_entries': 100}})
+        a, b = pool.get('store-a'), pool.get('store-b')
+
+        assert a.cache is b.cache
+        assert a.cache_ttl('products') == 60
+        assert a.products._cache_tag() != b.products._cache_tag()
+
+    def test_close(self):
+        """Tests closing the pool drops clients and closes the shared adapter"""
+
+        with SwellPool(STORES) as pool:
+            adapter = pool.options['http_adapter']
+            pool.get('store-a')
+
+        with patch.object(adapter, 'close') as close:
+            pool.close()
+
+        assert len(pool) == 0
+        close.assert_called_once()
+
+
+class TestAsyncSwellPool(unittest.TestCase):
+
+    def test_clients_share_transport(self):
+        """Tests async store clients send requests with their own credentials through one transport"""
+
+        import httpx
+
+        seen = []
+
+        def handler(request):
+            seen.append(base64.b64decode(request.headers['Authorization'].split()[1]).decode())
+            return httpx.Response(200, json={'results': []})
+
+        async def run():
+            async with AsyncSwellPool(STORES, {'rate_limit_calls': 100}) as pool:
+                await pool.options['transport'].aclose()
+                pool.options['transport'] = httpx.MockTransport(handler)
+
+                a, b = pool.get('store-a'), pool.get('store-b')
+                assert isinstance(a, AsyncSwell)
+                assert a._session._transport is b._session._transport
+
+                await asyncio.gather(a.products.list(), b.products.list())
+
+                # Closing a client leaves the shared transport open
+                await a.aclose()
+                await pool.get('store-b').products.list()
+
+        asyncio.run(run())
+
+        assert sorted(seen) == ['store-a:key-a', 'store-b:key-b', 'store-b:key-b']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from email.utils import formatdate
+import time
+import requests
+from requests.exceptions import HTTPError
+from swellpy import Swell
+from swellpy.retry import RetryPolicy
+
+
+def response(status_code, headers=None, json_data=None):
+    res = MagicMock(status_code=status_code, headers=headers or {}, reason='Reason')
+    res.json.return_value = json_data or {}
+    return res
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_no_retry_on_success_or_client_error(self):
+        """Tests non-retryable statuses are not retried"""
+
+        policy = RetryPolicy()
+
+        assert policy.next_delay('get', 1, response(200)) is None
+        assert policy.next_delay('get', 1, response(404)) is None
+
+    def test_exponential_backoff(self):
+        """Tests delays double per attempt up to the max"""
+
+        policy = RetryPolicy(max_attempts=10, backoff=1, max_backoff=5, jitter=False)
+
+        assert [policy.next_delay('get', attempt, response(503)) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+    def test_jittered_backoff(self):
+        """Tests jitter stays within the backoff delay"""
+
+        policy = RetryPolicy(backoff=2)
+
+        assert 0 <= policy.next_delay('get', 1, response(500)) <= 2
+
+    def test_max_attempts(self):
+        """Tests retries stop after max attempts"""
+
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.next_delay('get', 1, response(503)) is not None
+        assert policy.next_delay('get', 2, response(503)) is None
+
+    def test_retry_after_seconds(self):
+        """Tests Retry-After in seconds is honored"""
+
+        policy = RetryPolicy()
+
+        assert policy.next_delay('get', 1, response(429, {'Retry-After': '7'})) == 7
+
+    def test_retry_after_date(self):
+        """Tests Retry-After as an HTTP date is honored"""
+
+        policy = RetryPolicy()
+        delay = policy.next_delay('get', 1, response(503, {'Retry-After': formatdate(time.time() + 30, usegmt=True)}))
+
+        assert 25 < delay <= 30
+
+    def test_long_retry_after_is_not_waited_for(self):
+        """Tests a Retry-After beyond max_retry_after fails the request instead of waiting"""
+
+        policy = RetryPolicy(max_backoff=30)
+
+        assert policy.next_delay('get', 1, response(503, {'Retry-After': '86400'})) is None
+        assert RetryPolicy(max_retry_after=90000).next_delay('get', 1, response(503, {'Retry-After': '86400'})) == 86400
+
+    def test_post_only_retried_on_429(self):
+        """Tests POST requests are not retried unless safe"""
+
+        policy = RetryPolicy()
+
+        assert policy.next_delay('post', 1, response(503)) is None
+        assert policy.next_delay('post', 1) is None
+        assert policy.next_delay('post', 1, response(429)) is not None
+        assert RetryPolicy(retry_non_idempotent=True).next_delay('post', 1, response(503)) is not None
+
+
+@patch('time.sleep')
+class TestSwellRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        self.swell._session = MagicMock()
+
+    def test_retries_server_error(self, sleep):
+        """Tests a transient server error is retried"""
+
+        self.swell._session.get.side_effect = [response(503), response(200, json_data={'id': 'abc'})]
+
+        assert self.swell.products.get('abc') == {'id': 'abc'}
+        assert self.swell._session.get.call_count == 2
+        assert 0 <= sleep.call_args[0][0] <= 0.5
+
+    def test_retries_connection_error(self, sleep):
+        """Tests connection errors are retried for idempotent requests"""
+
+        self.swell._session.delete.side_effect = [requests.ConnectionError(), response(200)]
+
+        self.swell.products.delete('abc')
+        assert self.swell._session.delete.call_count == 2
+
+    def test_raises_after_max_attempts(self, sleep):
+        """Tests the error surfaces once attempts are exhausted"""
+
+        self.swell._session.get.return_value = response(503)
+
+        with self.assertRaises(HTTPError):
+            self.swell.products.list()
+
+        assert self.swell._session.get.call_count == 3
+
+    def test_real_error_response_raises_http_error(self, sleep):
+        """Tests a requests error response, which is falsy, raises HTTPError once retries run out"""
+
+        error = requests.Response()
+        error.status_code = 503
+        error.reason = 'Service Unavailable'
+        error.request = requests.Request('GET', 'https://api.swell.store/products').prepare()
+        self.swell._session.get.return_value = error
+
+        with self.assertRaisesRegex(HTTPError, 'HTTP Error 503'):
+            self.swell.products.list()
+
+        assert self.swell._session.get.call_count == 3
+
+    def test_throttling_pauses_shared_limiter(self, sleep):
+        """Tests a 429 slows down the whole client through the limiter"""
+
+        self.swell._session.post.side_effect = [response(429, {'Retry-After': '2'}), response(200)]
+
+        self.swell.orders.convert_cart_to_order('cart123')
+
+        assert self.swell._session.post.call_count == 2
+        self.assertAlmostEqual(sleep.call_args[0][0], 2, places=1)
+
+    def test_long_retry_after_does_not_pause_client(self, sleep):
+        """Tests an overlong Retry-After surfaces the error without pausing the shared limiter"""
+
+        self.swell._session.get.return_value = response(503, {'Retry-After': '86400'})
+
+        with self.assertRaises(HTTPError):
+            self.swell.products.list()
+
+        assert self.swell._session.get.call_count == 1
+        assert self.swell.limiter.wait_time == 0
+
+    def test_retry_options(self, sleep):
+        """Tests retries can be configured or disabled"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'retry': {'max_attempts': 1}}})
+        swell._session = MagicMock()
+        swell._session.get.return_value = response(503)
+
+        with self.assertRaises(HTTPError):
+            swell.webhooks.list_events()
+
+        assert swell._session.get.call_count == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
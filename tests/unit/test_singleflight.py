@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, AsyncMock
+from swellpy import Swell, AsyncSwell
+from swellpy.singleflight import SingleFlight, AsyncSingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_call(self):
+        """Tests concurrent calls with the same key run fn once"""
+
+        flights = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'id': 'abc'}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: flights.do('key', fetch), range(8)))
+
+        assert len(calls) == 1
+        assert results == [{'id': 'abc'}] * 8
+        assert len({id(result) for result in results}) == 8
+
+    def test_errors_are_shared(self):
+        """Tests every waiting caller receives the error"""
+
+        flights = SingleFlight()
+
+        def fetch():
+            time.sleep(0.1)
+            raise ValueError('failed')
+
+        def call(i):
+            try:
+                flights.do('key', fetch)
+            except ValueError:
+                return 'raised'
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(call, range(4))) == ['raised'] * 4
+
+    def test_sequential_calls_are_not_shared(self):
+        """Tests a finished call is not reused"""
+
+        flights = SingleFlight()
+        fetch = MagicMock(return_value={})
+
+        flights.do('key', fetch)
+        flights.do('key', fetch)
+
+        assert fetch.call_count == 2
+
+    def test_async_calls_share_one_call(self):
+        """Tests concurrent tasks with the same key await fn once"""
+
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {'id': 'abc'}
+
+        async def run():
+            return await asyncio.gather(*[flights.do('key', fetch) for i in range(5)], flights.do('other', fetch))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert results == [{'id': 'abc'}] * 6
+
+
+class TestCoalescedReads(unittest.TestCase):
+
+    def test_concurrent_gets_share_request(self):
+        """Tests concurrent identical gets send one request"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        swell._session = MagicMock()
+        started = threading.Event()
+
+        def get(url, params):
+            started.set()
+            time.sleep(0.1)
+            response = MagicMock(status_code=200)
+            response.json.return_value = {'id': 'abc'}
+            return response
+
+        swell._session.get.side_effect = get
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(lambda i: swell.products.get('abc'), range(6)))
+
+        assert results == [{'id': 'abc'}] * 6
+        assert swell._session.get.call_count == 1
+
+    def test_coalescing_can_be_disabled(self):
+        """Tests the coalesce_reads option"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'coalesce_reads': False}})
+
+        assert swell._flights is None
+
+    def test_async_concurrent_gets_share_request(self):
+        """Tests concurrent identical async gets send one request"""
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        swell._session = MagicMock()
+
+        async def get(url, params):
+            await asyncio.sleep(0.05)
+            response = MagicMock(status_code=200)
+            response.json.return_value = {'results': []}
+            return response
+
+        swell._session.get = AsyncMock(side_effect=get)
+
+        async def run():
+            return await asyncio.gather(*[swell.products.list({'limit': 5}) for i in range(5)])
+
+        assert asyncio.run(run()) == [{'results': []}] * 5
+        assert swell._session.get.call_count == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
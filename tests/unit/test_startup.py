@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import timeit
+import unittest
+from pathlib import Path
+from swellpy import Swell
+from swellpy.swell import MODELS
+from swellpy.models.base import Base
+
+ROOT = Path(__file__).resolve().parents[2]
+
+MODULES = """
+import json, sys, time
+start = time.perf_counter()
+import swellpy
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'modules': sorted(sys.modules)}))
+"""
+
+
+def run_python(code: str) -> dict:
+    env = {**os.environ, 'PYTHONPATH': str(ROOT)}
+    return json.loads(subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, env=env))
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_import_defers_models_and_optional_modules(self):
+        """Tests import swellpy loads no model, nor asyncio, sqlite3 or the async client"""
+
+        modules = run_python(MODULES)['modules']
+
+        assert not [module for module in modules if module.startswith('swellpy.models')]
+        for module in ('asyncio', 'sqlite3', 'swellpy.async_swell'):
+            assert module not in modules
+
+    def test_models_are_constructed_on_first_access(self):
+        """Tests a client constructs each model once, when first used"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+
+        assert not set(MODELS) & set(vars(swell))
+        orders = swell.orders
+        assert isinstance(orders, Base) and orders._swell is swell
+        assert swell.orders is orders
+        assert set(MODELS) & set(vars(swell)) == {'orders'}
+
+    def test_every_model_is_available(self):
+        """Tests every registered model can be constructed and is listed by dir"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+
+        for name in MODELS:
+            assert isinstance(getattr(swell, name), Base)
+        assert set(MODELS) <= set(dir(swell))
+
+        with self.assertRaises(AttributeError):
+            swell.unknown_model
+
+    def test_startup_benchmark(self):
+        """Benchmarks import and construction time against generous budgets"""
+
+        import_seconds = min(run_python(MODULES)['seconds'] for run in range(3))
+        params = {'store_id': 'store_id', 'api_key': 'api_key'}
+        construct_seconds = timeit.timeit(lambda: Swell(params), number=100) / 100
+
+        assert import_seconds < 1.0, f'import swellpy took {import_seconds * 1000:.0f} ms'
+        assert construct_seconds < 0.005, f'Swell() took {construct_seconds * 1000:.2f} ms'
+
+
+if __name__ == '__main__':
+    unittest.main()
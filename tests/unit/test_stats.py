@@ -0,0 +1,131 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+from swellpy import Swell
+from swellpy.stats import Histogram, StatsCollector
+
+
+def event(endpoint='products', method='GET', latency=0.1, status=200, error=None):
+    return {
+        'method': method, 'endpoint': endpoint, 'latency': latency, 'duration': 5, 'status': status, 'error': error,
+        'bytes': 100, 'retries': 0, 'limiter_wait': 0.01}
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_percentiles_within_precision(self):
+        """Tests percentiles are reported within the histogram precision"""
+
+        histogram = Histogram(precision=0.01)
+        values = [random.lognormvariate(-3, 1) for i in range(20000)]
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for percent in (50, 95, 99):
+            exact = values[int(len(values) * percent / 100) - 1]
+            assert abs(histogram.percentile(percent) - exact) / exact < 0.03
+        assert histogram.max == values[-1]
+        assert histogram.count == 20000
+
+    def test_memory_is_bounded(self):
+        """Tests the number of buckets does not grow with the number of values"""
+
+        histogram = Histogram()
+        for i in range(100000):
+            histogram.record(random.uniform(0.001, 10))
+
+        assert len(histogram._counts) <= histogram._buckets < 1200
+
+    def test_out_of_range_values(self):
+        """Tests values beyond the tracked range are clamped to the recorded extremes"""
+
+        histogram = Histogram(lowest=0.001, highest=1)
+        histogram.record(0)
+        histogram.record(5000)
+
+        assert histogram.percentile(1) == 0
+        assert histogram.percentile(100) == 5000
+
+    def test_empty(self):
+        """Tests an empty histogram has no percentiles"""
+
+        assert Histogram().percentile(50) is None
+        assert Histogram().mean is None
+
+
+class TestStatsCollector(unittest.TestCase):
+
+    def test_snapshot(self):
+        """Tests events are aggregated per method and endpoint"""
+
+        collector = StatsCollector()
+        for i in range(98):
+            collector(event(latency=0.1))
+        collector(event(latency=2, status=500))
+        collector(event(latency=0.5, error=ConnectionError()))
+        collector(event('orders', 'POST', latency=0.3))
+
+        snapshot = collector.snapshot()
+        products = snapshot['endpoints']['GET products']
+
+        assert snapshot['requests'] == 101
+        assert snapshot['errors'] == 2
+        assert snapshot['throughput'] > 0
+        assert products['count'] == 100
+        assert products['error_rate'] == 0.02
+        assert products['bytes'] == 10000
+        assert abs(products['p50'] - 0.1) < 0.002
+        assert abs(products['p99'] - 0.5) < 0.01
+        assert products['max'] == 2
+        assert snapshot['endpoints']['POST orders']['count'] == 1
+
+    def test_requests_without_latency(self):
+        """Tests requests failing before being sent are counted without a latency"""
+
+        collector = StatsCollector()
+        collector(event(latency=None, status=None, error=ConnectionError()))
+
+        products = collector.snapshot()['endpoints']['GET products']
+        assert (products['count'], products['errors'], products['p50'], products['max']) == (1, 1, None, None)
+
+    def test_reset(self):
+        """Tests a reset starts a new period"""
+
+        collector = StatsCollector()
+        collector(event())
+
+        assert collector.snapshot(reset=True)['requests'] == 1
+        assert collector.snapshot()['requests'] == 0
+
+        collector(event())
+        collector.reset()
+        assert collector.snapshot()['endpoints'] == {}
+
+
+class TestSwellStats(unittest.TestCase):
+
+    def test_swell_stats(self):
+        """Tests the stats option collects every request of the client"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100, 'stats': True}})
+        swell._session = MagicMock()
+        swell._session.get.return_value = MagicMock(status_code=200, content=b'{"results": []}')
+
+        swell.products.list()
+        swell.products.list({'page': 2})
+
+        assert swell.stats()['endpoints']['GET products']['count'] == 2
+        assert 0 <= swell.stats()['endpoints']['GET products']['p50'] < 1
+        assert swell.stats(reset=True)['requests'] == 2
+        assert swell.stats()['requests'] == 0
+
+    def test_stats_disabled(self):
+        """Tests stats must be enabled"""
+
+        with self.assertRaises(ValueError):
+            Swell({'store_id': 'store_id', 'api_key': 'api_key'}).stats()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+from requests.exceptions import HTTPError
+from swellpy import Swell, AsyncSwell
+from swellpy.streaming import ResultsParser, iter_results
+
+
+def chunked(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+PAGE = {
+    'count': 3,
+    'results': [
+        {'id': 'a', 'name': 'Ünïcode “quotes”', 'price': 1.5, 'tags': ['x', {'y': [1, 2]}]},
+        {'id': 'b', 'name': 'escaped \\"}]', 'price': 10},
+        {'id': 'c', 'active': True, 'parent': None},
+    ],
+    'page': 1,
+}
+
+
+class TestResultsParser(unittest.TestCase):
+
+    def test_parses_any_chunking(self):
+        """Tests items and fields are parsed whatever the chunk boundaries"""
+
+        data = json.dumps(PAGE, ensure_ascii=False, indent=1).encode()
+
+        for size in (1, 2, 3, 7, 64, len(data)):
+            parser = ResultsParser()
+            assert list(iter_results(chunked(data, size), parser)) == PAGE['results']
+            assert parser.meta == {'count': 3, 'page': 1}
+
+    def test_items_are_returned_as_they_complete(self):
+        """Tests an item is returned by the chunk completing it"""
+
+        parser = ResultsParser()
+
+        assert parser.feed(b'{"count": 2, "results": [{"id": "a"') == []
+        assert parser.feed(b'}, {"id": ') == [{'id': 'a'}]
+        assert parser.feed(b'"b"}]') == [{'id': 'b'}]
+        assert parser.feed(b'}') == []
+        assert parser.meta == {'count': 2}
+        parser.close()
+
+    def test_large_item_is_decoded_once(self):
+        """Tests an item spanning many chunks is decoded once, when its last chunk arrives"""
+
+        item = {'id': 'a', 'variants': [{'name': f'"{{[{i}', 'options': [[i], {'x': None}]} for i in range(2000)]}
+        data = json.dumps({'count': 1, 'results': [item]}).encode()
+
+        with patch('swellpy.codec.loads', side_effect=json.loads) as loads:
+            assert list(iter_results(chunked(data, 1024), ResultsParser())) == [item]
+
+        assert loads.call_count == 4
+
+    def test_fields_after_results(self):
+        """Tests fields following the results array are collected"""
+
+        parser = ResultsParser()
+
+        assert list(iter_results([b'{"results": [], "count": 12}'], parser)) == []
+        assert parser.meta == {'count': 12}
+
+    def test_truncated_response_raises(self):
+        """Tests a response cut short raises a ValueError"""
+
+        with self.assertRaises(ValueError):
+            list(iter_results([b'{"results": [{"id": "a"}, {"id"'], ResultsParser()))
+
+    def test_invalid_response_raises(self):
+        """Tests a response that is not a JSON object raises a ValueError"""
+
+        with self.assertRaises(ValueError):
+            list(iter_results([b'[{"id": "a"}]'], ResultsParser()))
+
+
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        self.swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+        self.swell._session = MagicMock()
+        self.swell._base_url = 'https://store_id:api_key'
+
+    def response(self, page: dict, status_code: int = 200):
+        response = MagicMock(status_code=status_code)
+        response.iter_content.side_effect = lambda chunk_size: iter(chunked(json.dumps(page).encode(), 5))
+        return response
+
+    def test_stream(self):
+        """Tests stream yields the items of a streamed response"""
+
+        self.swell._session.get.return_value = self.response(PAGE)
+
+        assert list(self.swell.products.stream({'limit': 3})) == PAGE['results']
+        self.swell._session.get.assert_called_once_with(
+            url='https://store_id:api_key/products', params={'limit': 3}, stream=True)
+        self.swell._session.get.return_value.close.assert_called_once()
+
+    def test_stream_error(self):
+        """Tests an error response raises before any item"""
+
+        self.swell._session.get.return_value = self.response({}, 404)
+
+        with self.assertRaises(HTTPError):
+            list(self.swell.products.stream())
+
+    def test_iterate_stream(self):
+        """Tests iterate streams every page"""
+
+        pages = [{'count': 5, 'results': [{'id': str(i)} for i in range(n, min(n + 2, 5))]} for n in (0, 2, 4)]
+        self.swell._session.get.side_effect = [self.response(page) for page in pages]
+
+        items = list(self.swell.products.iterate(page_size=2, stream=True))
+
+        assert [item['id'] for item in items] == ['0', '1', '2', '3', '4']
+        assert [call.kwargs['params']['page'] for call in self.swell._session.get.call_args_list] == [1, 2, 3]
+
+    def test_iterate_stream_keyset(self):
+        """Tests keyset iteration continues after the last streamed item"""
+
+        items = [{'id': str(i), 'date_created': f'2022-01-0{i + 1}'} for i in range(3)]
+        self.swell._session.get.side_effect = [
+            self.response({'results': items[:2]}), self.response({'results': items[2:]})]
+
+        assert list(self.swell.orders.iterate(page_size=2, stream=True)) == items
+        assert self.swell._session.get.call_args_list[1].kwargs['params']['where[$or][1][id][$gt]'] == '1'
+
+    def test_async_client_requires_astream(self):
+        """Tests stream cannot be used with an AsyncSwell client"""
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key'})
+
+        with self.assertRaises(TypeError):
+            swell.products.stream()
+
+
+class TestAsyncStream(unittest.TestCase):
+
+    def test_astream(self):
+        """Tests astream yields the items of a streamed httpx response"""
+
+        import httpx
+
+        def handler(request):
+            assert request.url.params['limit'] == '3'
+            return httpx.Response(200, content=json.dumps(PAGE).encode())
+
+        async def run():
+            swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+            swell._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            swell._base_url = 'https://api.swell.store'
+            async with swell:
+                return [item async for item in swell.products.astream({'limit': 3})]
+
+        assert asyncio.run(run()) == PAGE['results']
+
+    def test_aiterate_stream(self):
+        """Tests aiterate streams every page"""
+
+        import httpx
+
+        def handler(request):
+            page = int(request.url.params['page'])
+            results = [{'id': str(i)} for i in range(page * 2 - 2, min(page * 2, 3))]
+            return httpx.Response(200, content=json.dumps({'count': 3, 'results': results}).encode())
+
+        async def run():
+            swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'rate_limit_calls': 100}})
+            swell._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            swell._base_url = 'https://api.swell.store'
+            async with swell:
+                return [item['id'] async for item in swell.products.aiterate(page_size=2, stream=True)]
+
+        assert asyncio.run(run()) == ['0', '1', '2']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import unittest
+from unittest.mock import patch
+from requests import PreparedRequest, Session
+from requests.exceptions import HTTPError
+from swellpy import Swell, AsyncSwell
+from swellpy.transport import TimeoutHTTPAdapter, HTTP2Session
+
+
+class TestTransport(unittest.TestCase):
+
+    def test_default_session(self):
+        """Tests the session authenticates against the API with a tuned adapter"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+        adapter = swell._session.get_adapter(f'{swell._base_url}/products')
+
+        assert swell._base_url == 'https://api.swell.store'
+        assert swell._session.auth == ('store_id', 'api_key')
+        assert isinstance(adapter, TimeoutHTTPAdapter)
+        assert adapter.timeout == (10, 60)
+        assert adapter._pool_maxsize == 100
+        assert swell._session.headers['Connection'] == 'keep-alive'
+
+    def test_session_options(self):
+        """Tests pool size, blocking, keep-alive and timeouts are configurable"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'max_connections': 8, 'pool_block': True, 'keep_alive': False,
+            'connect_timeout': 2, 'read_timeout': None}})
+        adapter = swell._session.get_adapter(swell._base_url)
+
+        assert adapter._pool_maxsize == 8
+        assert adapter._pool_block is True
+        assert adapter.timeout == (2, None)
+        assert swell._session.headers['Connection'] == 'close'
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_adapter_applies_default_timeout(self, send):
+        """Tests the default timeout only applies to requests sent without one"""
+
+        adapter = TimeoutHTTPAdapter(timeout=(1, 5))
+        request = PreparedRequest()
+
+        adapter.send(request, timeout=None)
+        adapter.send(request, timeout=30)
+
+        assert [call[1]['timeout'] for call in send.call_args_list] == [(1, 5), 30]
+
+    def test_async_client_options(self):
+        """Tests the async client pool and timeouts follow the same options"""
+
+        import httpx
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'max_connections': 8, 'keep_alive': False, 'connect_timeout': 2, 'read_timeout': 30}})
+        pool = swell._session._transport._pool
+
+        assert swell._session.timeout == httpx.Timeout(30, connect=2, pool=None)
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 0
+
+
+class TestHTTP2(unittest.TestCase):
+
+    def test_sync_http2(self):
+        """Tests the sync client sends requests over HTTP/2 with httpx"""
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'http2': True}})
+
+        assert isinstance(swell._session, HTTP2Session)
+        assert swell._session.client._transport._pool._http2 is True
+        assert swell._session.client.timeout.connect == 10
+
+    def test_sync_http2_requests(self):
+        """Tests reads, writes and streams go through the HTTP/2 session"""
+
+        import httpx
+
+        def handler(request):
+            if request.method == 'POST':
+                return httpx.Response(200, json={'id': 'abc', **json.loads(request.content)})
+            return httpx.Response(200, json={'count': 1, 'results': [{'id': 'abc'}]})
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'http2': True, 'rate_limit_calls': 100}})
+        swell._session = HTTP2Session(httpx.Client(transport=httpx.MockTransport(handler)))
+
+        assert swell.products.create({'name': 'Product'}) == {'id': 'abc', 'name': 'Product'}
+        assert swell.products.list({'limit': 1}) == {'count': 1, 'results': [{'id': 'abc'}]}
+        assert list(swell.products.stream({'limit': 1})) == [{'id': 'abc'}]
+
+    def test_sync_http2_stream_error(self):
+        """Tests a failed HTTP/2 stream raises HTTPError when its request is observed by a hook"""
+
+        import httpx
+
+        def handler(request):
+            return httpx.Response(404, content=iter([b'{"error": "Not found"}']))
+
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {
+            'http2': True, 'rate_limit_calls': 100, 'stats': True}})
+        swell._session = HTTP2Session(httpx.Client(transport=httpx.MockTransport(handler)))
+
+        with self.assertRaises(HTTPError):
+            list(swell.products.stream())
+
+        assert swell.stats()['endpoints']['GET products']['errors'] == 1
+
+    def test_sync_close(self):
+        """Tests closing a client closes its own connections but leaves a shared transport open"""
+
+        import httpx
+
+        with Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'http2': True}}) as swell:
+            client = swell._session.client
+        assert client.is_closed
+
+        transport = httpx.HTTPTransport(http2=True)
+        shared = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'http2': True, 'transport': transport}})
+        with patch.object(transport, 'close') as close:
+            shared.close()
+        close.assert_not_called()
+
+        with patch.object(Session, 'close') as close:
+            Swell({'store_id': 'store_id', 'api_key': 'api_key'}).close()
+        close.assert_called_once()
+
+        with self.assertRaises(TypeError):
+            AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key'}).close()
+
+    def test_http2_falls_back_without_h2(self):
+        """Tests clients fall back to HTTP/1.1 when HTTP/2 support is not installed"""
+
+        options = {'store_id': 'store_id', 'api_key': 'api_key', 'options': {'http2': True}}
+
+        with patch('swellpy.swell.http2_available', return_value=False), self.assertLogs('swellpy.swell', 'WARNING'):
+            assert isinstance(Swell(options)._session, Session)
+        with patch('swellpy.async_swell.http2_available', return_value=False), self.assertLogs('swellpy.swell', 'WARNING'):
+            assert AsyncSwell(options)._session._transport._pool._http2 is False
+
+    def test_async_http2(self):
+        """Tests the async client multiplexes requests over HTTP/2"""
+
+        swell = AsyncSwell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'http2': True}})
+
+        assert swell._session._transport._pool._http2 is True
+
+
+if __name__ == '__main__':
+    unittest.main()
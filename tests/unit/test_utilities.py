@@ -1,8 +1,12 @@
 import unittest
 from unittest.mock import MagicMock
 from urllib.error import HTTPError
-from swellpy.utilities import handle_requests_response
+import logging
+from swellpy import Swell
+from swellpy.utilities import handle_requests_response, encode_params, diff_payload, log_response
+from datetime import datetime
 from unittest.mock import patch
+from requests import PreparedRequest, Response
 from requests.exceptions import HTTPError
 class TestUtils(unittest.TestCase):
 
@@ -69,6 +73,95 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(HTTPError):
             handle_requests_response(swell, json_response)
 
+    def test_real_error_responses(self):
+        """Test requests error responses, which are falsy, raise HTTPError"""
+
+        for status_code, reason in ((404, 'Not Found'), (503, 'Service Unavailable')):
+            response = Response()
+            response.status_code = status_code
+            response.reason = reason
+            response._content = b'{"error": "failed"}'
+            response.request = PreparedRequest()
+            response.request.prepare(method='GET', url='https://api.swell.store/products/abc')
+
+            with self.assertRaisesRegex(HTTPError, f'HTTP Error {status_code}: {reason}'):
+                handle_requests_response(swell, response)
+
+    def test_missing_response(self):
+        """Test a missing response raises an exception"""
+
+        with self.assertRaisesRegex(Exception, 'No response received'):
+            handle_requests_response(swell, None)
+
+    def test_log_response(self):
+        """Test the request line is logged with lazy arguments"""
+
+        log_response(swell, ResponseObj({}))
+
+        swell.logger.debug.assert_called_with('%s %s [HTTP %s]', 'GET', 'abc/def', 200)
+
+    def test_log_response_disabled(self):
+        """Test nothing is logged or formatted when debug logging is disabled"""
+
+        swell.logger.isEnabledFor.return_value = False
+
+        handle_requests_response(swell, ResponseObj({"errors": {"slug": "errorinfo"}}))
+
+        swell.logger.debug.assert_not_called()
+
+    def test_logger_level_not_forced(self):
+        """Test a client leaves the logger level to the application"""
+
+        logger = logging.getLogger('swellpy.swell')
+        logger.setLevel(logging.WARNING)
+        try:
+            Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+            self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+    @patch('random.random')
+    def test_log_sample_rate(self, random):
+        """Test only the sampled share of requests is logged"""
+
+        client = Swell({'store_id': 'store_id', 'api_key': 'api_key', 'options': {'log_sample_rate': 0.1}})
+
+        random.return_value = 0.05
+        self.assertTrue(client._log_sampled())
+        random.return_value = 0.5
+        self.assertFalse(client._log_sampled())
+
+    def test_encode_flat_params(self):
+        """Test flat params are left unchanged"""
+
+        params = {'limit': 10, 'expand': ['variants', 'categories']}
+
+        self.assertEqual(encode_params(params), params)
+
+    def test_encode_nested_params(self):
+        """Test nested params are flattened into bracket notation"""
+
+        encoded = encode_params({
+            'where': {'id': {'$in': ['a', 'b']}, 'active': True},
+            'date_created': {'$gte': datetime(2022, 1, 1)},
+        })
+
+        self.assertEqual(encoded, {
+            'where[id][$in][0]': 'a',
+            'where[id][$in][1]': 'b',
+            'where[active]': 'true',
+            'date_created[$gte]': '2022-01-01T00:00:00',
+        })
+
+    def test_diff_payload(self):
+        """Test only new or changed fields are returned"""
+
+        base = {'id': 'abc', 'name': 'Product', 'options': [{'name': 'Size'}], 'price': 10}
+        payload = {'id': 'abc', 'name': 'Product', 'options': [{'name': 'Color'}], 'sku': 'SKU1'}
+
+        self.assertEqual(diff_payload(payload, base), {'options': [{'name': 'Color'}], 'sku': 'SKU1'})
+        self.assertEqual(diff_payload(base, base), {})
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import MagicMock
 from swellpy.models.webhooks import Webhooks
 from swellpy.models.base import Base
+from swellpy import Swell
 
 
 class TestEvents(unittest.TestCase):
@@ -13,14 +14,11 @@ class TestEvents(unittest.TestCase):
                 self.get = MagicMock()
                 self.get.return_value.status_code = 200
 
-        class SwellMock:
-            def __init__(self):
-                self._session = SessionMock()
-                self._base_url = 'https://store_id:api_key'
-
         global webhook_model, swell
 
-        swell = SwellMock()
+        swell = Swell({'store_id': 'store_id', 'api_key': 'api_key'})
+        swell._session = SessionMock()
+        swell._base_url = 'https://store_id:api_key'
         webhook_model = Webhooks(swell)
 
 